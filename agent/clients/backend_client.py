@@ -1,12 +1,20 @@
 import aiohttp
 import asyncio
-import json
 import logging
+import orjson
 import os
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Transient failures (dropped connections, timeouts, a restarting backend) are
+# retried with exponential backoff so one blip doesn't lose a report until the
+# next poll. Other statuses, including 500, are returned as-is.
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # seconds; doubles each attempt
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
 
 class BackendClient:
     def __init__(self, backend_url: str):
@@ -17,6 +25,54 @@ class BackendClient:
                 "SERVICE_TOKEN is not set; outbound requests will be sent without "
                 "an X-Service-Token header and will be rejected by the backend with 401."
             )
+        # Shared across calls so reports reuse warm keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @asynccontextmanager
+    async def _request(self, method: str, path: str, **kwargs):
+        """Open a request to a backend path, retrying transient failures.
+
+        Yields the final response; the last connection error or timeout is
+        re-raised once attempts run out.
+        """
+        session = await self._get_session()
+        url = f"{self.backend_url}{path}"
+        yielded = False
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            last_attempt = attempt == RETRY_MAX_ATTEMPTS - 1
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    if response.status not in RETRY_STATUSES or last_attempt:
+                        yielded = True
+                        yield response
+                        return
+                    logger.debug(f"{method} {path} returned HTTP {response.status}, retrying")
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                # Errors raised by the caller while handling the response are not ours to retry
+                if yielded or last_attempt:
+                    raise
+                logger.debug(f"{method} {path} failed ({e!r}), retrying")
+            await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt)
 
     def _headers(self, content_type: str = None) -> dict:
         """Build request headers, including the service token for ingest auth."""
@@ -34,39 +90,38 @@ class BackendClient:
         try:
             logger.info(f"Sending failure report for pod {pod_identifier} to backend")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                        f"{self.backend_url}/api/pods/failed",
-                        json=pod_data,
-                        headers=self._headers('application/json'),
-                        timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Successfully reported pod {pod_identifier}")
-                        return True
-                    else:
-                        # Try to get detailed error message from response
+            async with self._request(
+                    'POST', '/api/pods/failed',
+                    json=pod_data,
+                    headers=self._headers('application/json'),
+                    timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Successfully reported pod {pod_identifier}")
+                    return True
+                else:
+                    # Try to get detailed error message from response
+                    try:
+                        error_data = await response.json(loads=orjson.loads)
+                        error_msg = error_data.get('message', error_data.get('detail', 'Unknown error'))
+                        error_type = error_data.get('error_type', 'Unknown')
+                        error_id = error_data.get('error_id')
+                        
+                        logger.error(f"Backend returned HTTP {response.status} for pod {pod_identifier}")
+                        logger.error(f"Error type: {error_type}")
+                        logger.error(f"Error message: {error_msg}")
+                        if error_id:
+                            logger.error(f"Backend error ID: {error_id}")
+                    except Exception:
+                        # If we can't parse JSON, get text response
                         try:
-                            error_data = await response.json()
-                            error_msg = error_data.get('message', error_data.get('detail', 'Unknown error'))
-                            error_type = error_data.get('error_type', 'Unknown')
-                            error_id = error_data.get('error_id')
-                            
-                            logger.error(f"Backend returned HTTP {response.status} for pod {pod_identifier}")
-                            logger.error(f"Error type: {error_type}")
-                            logger.error(f"Error message: {error_msg}")
-                            if error_id:
-                                logger.error(f"Backend error ID: {error_id}")
+                            error_text = await response.text()
+                            logger.error(f"Backend returned HTTP {response.status} for pod {pod_identifier}: {error_text}")
                         except Exception:
-                            # If we can't parse JSON, get text response
-                            try:
-                                error_text = await response.text()
-                                logger.error(f"Backend returned HTTP {response.status} for pod {pod_identifier}: {error_text}")
-                            except Exception:
-                                logger.error(f"Backend returned HTTP {response.status} for pod {pod_identifier} (no response body)")
-                        
-                        return False
-                        
+                            logger.error(f"Backend returned HTTP {response.status} for pod {pod_identifier} (no response body)")
+                    
+                    return False
+                    
         except asyncio.TimeoutError:
             logger.error(f"Timeout while reporting pod {pod_identifier} to backend (30s)")
             return False
@@ -84,26 +139,25 @@ class BackendClient:
         try:
             logger.info(f"Notifying backend that pod {pod_identifier} was deleted")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                        f"{self.backend_url}/api/pods/dismiss-deleted",
-                        json={"namespace": namespace, "pod_name": pod_name},
-                        headers=self._headers('application/json'),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Successfully notified backend of deleted pod {pod_identifier}")
-                        return True
-                    else:
-                        # Try to get detailed error message from response
-                        try:
-                            error_data = await response.json()
-                            error_msg = error_data.get('message', error_data.get('detail', 'Unknown error'))
-                            logger.warning(f"Backend returned HTTP {response.status} for dismiss of pod {pod_identifier}: {error_msg}")
-                        except Exception:
-                            logger.warning(f"Backend returned HTTP {response.status} for dismiss of pod {pod_identifier}")
-                        return False
-                        
+            async with self._request(
+                    'POST', '/api/pods/dismiss-deleted',
+                    json={"namespace": namespace, "pod_name": pod_name},
+                    headers=self._headers('application/json'),
+                    timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Successfully notified backend of deleted pod {pod_identifier}")
+                    return True
+                else:
+                    # Try to get detailed error message from response
+                    try:
+                        error_data = await response.json(loads=orjson.loads)
+                        error_msg = error_data.get('message', error_data.get('detail', 'Unknown error'))
+                        logger.warning(f"Backend returned HTTP {response.status} for dismiss of pod {pod_identifier}: {error_msg}")
+                    except Exception:
+                        logger.warning(f"Backend returned HTTP {response.status} for dismiss of pod {pod_identifier}")
+                    return False
+                    
         except asyncio.TimeoutError:
             logger.warning(f"Timeout while notifying backend of deleted pod {pod_identifier} (10s)")
             return False
@@ -117,20 +171,19 @@ class BackendClient:
     async def get_excluded_namespaces(self) -> list:
         """Get list of excluded namespaces from backend"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                        f"{self.backend_url}/api/admin/excluded-namespaces",
-                        headers=self._headers(),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        namespaces = [item.get('namespace') for item in data if item.get('namespace')]
-                        logger.debug(f"Fetched excluded namespaces: {namespaces}")
-                        return namespaces
-                    else:
-                        logger.warning(f"Backend returned HTTP {response.status} for excluded namespaces")
-                        return []
+            async with self._request(
+                    'GET', '/api/admin/excluded-namespaces',
+                    headers=self._headers(),
+                    timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    namespaces = [item.get('namespace') for item in data if item.get('namespace')]
+                    logger.debug(f"Fetched excluded namespaces: {namespaces}")
+                    return namespaces
+                else:
+                    logger.warning(f"Backend returned HTTP {response.status} for excluded namespaces")
+                    return []
 
         except asyncio.TimeoutError:
             logger.warning("Timeout while fetching excluded namespaces (10s)")
@@ -145,21 +198,20 @@ class BackendClient:
     async def get_excluded_pods(self) -> list:
         """Get list of excluded pod names from backend (for pod monitoring exclusions)"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                        f"{self.backend_url}/api/admin/excluded-pods",
-                        headers=self._headers(),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # Return list of pod names only
-                        pods = [item.get('pod_name') for item in data if item.get('pod_name')]
-                        logger.debug(f"Fetched excluded pods: {pods}")
-                        return pods
-                    else:
-                        logger.warning(f"Backend returned HTTP {response.status} for excluded pods")
-                        return []
+            async with self._request(
+                    'GET', '/api/admin/excluded-pods',
+                    headers=self._headers(),
+                    timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    # Return list of pod names only
+                    pods = [item.get('pod_name') for item in data if item.get('pod_name')]
+                    logger.debug(f"Fetched excluded pods: {pods}")
+                    return pods
+                else:
+                    logger.warning(f"Backend returned HTTP {response.status} for excluded pods")
+                    return []
 
         except asyncio.TimeoutError:
             logger.warning("Timeout while fetching excluded pods (10s)")
@@ -174,22 +226,21 @@ class BackendClient:
     async def get_failed_pods(self) -> list:
         """Get list of currently failed pods from backend (for startup sync)"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                        f"{self.backend_url}/api/pods/failed",
-                        headers=self._headers(),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # Return list of (namespace, pod_name) tuples
-                        pods = [(item.get('namespace'), item.get('pod_name')) for item in data
-                                if item.get('namespace') and item.get('pod_name')]
-                        logger.info(f"Fetched {len(pods)} failed pods from backend for sync")
-                        return pods
-                    else:
-                        logger.warning(f"Backend returned HTTP {response.status} for failed pods")
-                        return []
+            async with self._request(
+                    'GET', '/api/pods/failed',
+                    headers=self._headers(),
+                    timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    # Return list of (namespace, pod_name) tuples
+                    pods = [(item.get('namespace'), item.get('pod_name')) for item in data
+                            if item.get('namespace') and item.get('pod_name')]
+                    logger.info(f"Fetched {len(pods)} failed pods from backend for sync")
+                    return pods
+                else:
+                    logger.warning(f"Backend returned HTTP {response.status} for failed pods")
+                    return []
 
         except asyncio.TimeoutError:
             logger.warning("Timeout while fetching failed pods (10s)")
@@ -1,7 +1,7 @@
 import asyncio
 import aiohttp
-import json
 import logging
+import orjson
 import os
 from typing import Callable, Optional
 
@@ -71,7 +71,7 @@ class WebSocketClient:
     async def _handle_message(self, data: str):
         """Handle incoming WebSocket message"""
         try:
-            message = json.loads(data)
+            message = orjson.loads(data)
             msg_type = message.get('type')
 
             if msg_type == 'namespace_exclusion_change':
@@ -90,7 +90,7 @@ class WebSocketClient:
                 if self.on_pod_exclusion_change:
                     await self.on_pod_exclusion_change(pod_name, action)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Failed to parse WebSocket message: {e}")
         except Exception as e:
             logger.error(f"Error handling WebSocket message: {e}")
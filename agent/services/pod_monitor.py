@@ -13,6 +13,9 @@ from config.config import Config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Failed-pod reports in flight at once; each waits on the backend's solution lookup
+FAILED_POD_REPORT_CONCURRENCY = 4
+
 
 class PodMonitor:
     # System namespaces that are always excluded
@@ -173,6 +176,7 @@ class PodMonitor:
             for task in tasks:
                 task.cancel()
             await self.websocket_client.disconnect()
+            await self.backend_client.close()
 
     async def _check_failed_pods(self):
         """Check for failed pods across all namespaces"""
@@ -182,13 +186,16 @@ class PodMonitor:
             # Build map of current pods for recovery checking
             current_pods = set()
             current_pods_map = {}
+            failed_pods = []
             for pod in pods.items:
                 pod_key = f"{pod.metadata.namespace}/{pod.metadata.name}"
                 current_pods.add(pod_key)
                 current_pods_map[pod_key] = pod
 
                 if self._is_pod_failed(pod) and self._should_report_pod(pod):
-                    await self._handle_failed_pod(pod)
+                    failed_pods.append(pod)
+
+            await self._handle_failed_pods(failed_pods)
 
             # Check for recovered pods (previously failed, now healthy)
             await self._check_recovered_pods(current_pods_map)
@@ -290,6 +297,16 @@ class PodMonitor:
 
         return True
 
+    async def _handle_failed_pods(self, pods: List):
+        """Handle several failed pods concurrently, up to FAILED_POD_REPORT_CONCURRENCY at a time"""
+        semaphore = asyncio.Semaphore(FAILED_POD_REPORT_CONCURRENCY)
+
+        async def handle_one(pod):
+            async with semaphore:
+                await self._handle_failed_pod(pod)
+
+        await asyncio.gather(*(handle_one(pod) for pod in pods))
+
     async def _handle_failed_pod(self, pod):
         """Handle a failed pod by collecting data and sending to backend"""
         pod_key = f"{pod.metadata.namespace}/{pod.metadata.name}"
@@ -36,13 +36,11 @@ class TestBackendClient:
 
             # Create session instance
             mock_session = AsyncMock()
-            mock_session.post = Mock(return_value=mock_post_cm)
+            mock_session.request = Mock(return_value=mock_post_cm)
 
-            # Create proper async context manager for session
-            mock_session_cm = AsyncMock()
-            mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-            mock_session_class.return_value = mock_session_cm
+            # The client keeps the session it creates and reuses it
+            mock_session.closed = False
+            mock_session_class.return_value = mock_session
 
             result = await backend_client.report_failed_pod(mock_pod_data)
 
@@ -59,7 +57,7 @@ class TestBackendClient:
                 "message": "Internal server error",
                 "error_type": "DatabaseError"
             })
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
+            mock_session.return_value.request.return_value.__aenter__.return_value = mock_response
             
             result = await backend_client.report_failed_pod(mock_pod_data)
             
@@ -70,7 +68,7 @@ class TestBackendClient:
         """Test pod failure reporting with timeout"""
         with patch('aiohttp.ClientSession') as mock_session:
             # Mock timeout
-            mock_session.return_value.__aenter__.return_value.post.side_effect = aiohttp.ClientTimeout()
+            mock_session.return_value.request.side_effect = aiohttp.ClientTimeout()
             
             result = await backend_client.report_failed_pod(mock_pod_data)
             
@@ -81,7 +79,7 @@ class TestBackendClient:
         """Test pod failure reporting with client error"""
         with patch('aiohttp.ClientSession') as mock_session:
             # Mock client error
-            mock_session.return_value.__aenter__.return_value.post.side_effect = aiohttp.ClientError("Connection failed")
+            mock_session.return_value.request.side_effect = aiohttp.ClientError("Connection failed")
             
             result = await backend_client.report_failed_pod(mock_pod_data)
             
@@ -102,13 +100,11 @@ class TestBackendClient:
 
             # Create session instance
             mock_session = AsyncMock()
-            mock_session.post = Mock(return_value=mock_post_cm)
+            mock_session.request = Mock(return_value=mock_post_cm)
 
-            # Create proper async context manager for session
-            mock_session_cm = AsyncMock()
-            mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-            mock_session_class.return_value = mock_session_cm
+            # The client keeps the session it creates and reuses it
+            mock_session.closed = False
+            mock_session_class.return_value = mock_session
 
             result = await backend_client.dismiss_deleted_pod("default", "deleted-pod")
 
@@ -124,12 +120,50 @@ class TestBackendClient:
             mock_response.json = AsyncMock(return_value={
                 "message": "Pod not found"
             })
-            mock_session.return_value.__aenter__.return_value.post.return_value.__aenter__.return_value = mock_response
+            mock_session.return_value.request.return_value.__aenter__.return_value = mock_response
             
             result = await backend_client.dismiss_deleted_pod("default", "missing-pod")
             
             assert result == False
 
+    @pytest.mark.asyncio
+    async def test_session_is_reused_until_closed(self, backend_client):
+        """Calls share one HTTP session and close() releases it"""
+        first = await backend_client._get_session()
+        assert await backend_client._get_session() is first
+
+        await backend_client.close()
+        assert first.closed
+
+        second = await backend_client._get_session()
+        assert second is not first
+        await backend_client.close()
+
+    @pytest.mark.asyncio
+    async def test_report_failed_pod_retries_transient_error(self, backend_client, mock_pod_data, monkeypatch):
+        """A dropped connection is retried instead of losing the report"""
+        monkeypatch.setattr('clients.backend_client.RETRY_BASE_DELAY', 0)
+        with patch('clients.backend_client.aiohttp.ClientSession') as mock_session_class:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+
+            mock_request_cm = AsyncMock()
+            mock_request_cm.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_request_cm.__aexit__ = AsyncMock(return_value=None)
+
+            mock_session = AsyncMock()
+            mock_session.request = Mock(side_effect=[
+                aiohttp.ClientConnectionError("Connection reset"),
+                mock_request_cm,
+            ])
+            mock_session.closed = False
+            mock_session_class.return_value = mock_session
+
+            result = await backend_client.report_failed_pod(mock_pod_data)
+
+            assert result is True
+            assert mock_session.request.call_count == 2
+
     def test_backend_url_normalization(self):
         """Test that backend URL is properly normalized"""
         client1 = BackendClient("http://test-backend:8000/")
@@ -177,18 +211,16 @@ class TestBackendClient:
             mock_post_cm.__aenter__ = AsyncMock(return_value=mock_response)
             mock_post_cm.__aexit__ = AsyncMock(return_value=None)
 
-            def fake_post(url, **kwargs):
+            def fake_request(method, url, **kwargs):
                 captured['url'] = url
                 captured['headers'] = kwargs.get('headers')
                 return mock_post_cm
 
             mock_session = AsyncMock()
-            mock_session.post = Mock(side_effect=fake_post)
+            mock_session.request = Mock(side_effect=fake_request)
 
-            mock_session_cm = AsyncMock()
-            mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-            mock_session_class.return_value = mock_session_cm
+            mock_session.closed = False
+            mock_session_class.return_value = mock_session
 
             result = await client.report_failed_pod(mock_pod_data)
 
@@ -1,7 +1,8 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta, timezone
-from services.pod_monitor import PodMonitor
+from services.pod_monitor import FAILED_POD_REPORT_CONCURRENCY, PodMonitor
 
 
 class TestPodMonitor:
@@ -214,4 +215,33 @@ class TestPodMonitor:
         
         # Verify pod was NOT marked as reported on failure
         pod_key = f"{mock_pod_failed.metadata.namespace}/{mock_pod_failed.metadata.name}"
-        assert pod_key not in pod_monitor.reported_pods
\ No newline at end of file
+        assert pod_key not in pod_monitor.reported_pods
+
+    @pytest.mark.asyncio
+    async def test_handle_failed_pods_reports_concurrently(self, pod_monitor):
+        """Test failed pods are reported concurrently, bounded by the report limit"""
+        pods = []
+        for i in range(FAILED_POD_REPORT_CONCURRENCY * 2):
+            pod = Mock()
+            pod.metadata.name = f"failed-pod-{i}"
+            pod.metadata.namespace = "default"
+            pods.append(pod)
+
+        in_flight = 0
+        peak = 0
+
+        async def report(pod_data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        pod_monitor.backend_client.report_failed_pod.side_effect = report
+
+        await pod_monitor._handle_failed_pods(pods)
+
+        assert pod_monitor.backend_client.report_failed_pod.await_count == len(pods)
+        assert peak == FAILED_POD_REPORT_CONCURRENCY
+        assert all(f"default/{pod.metadata.name}" in pod_monitor.reported_pods for pod in pods)
@@ -3,9 +3,15 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 import traceback
+import zlib
 
 logger = logging.getLogger(__name__)
 
+# Cap on the decompressed size of a gzip request body (guards against zip bombs)
+GZIP_REQUEST_MAX_BYTES = 32 * 1024 * 1024
+# Cap on the compressed bytes buffered before decompressing (this runs before auth)
+GZIP_REQUEST_MAX_COMPRESSED_BYTES = 8 * 1024 * 1024
+
 def configure_cors(app):
     """Configure CORS middleware"""
     app.add_middleware(
@@ -16,6 +22,80 @@ def configure_cors(app):
         allow_headers=["*"],
     )
 
+class GzipRequestMiddleware:
+    """Decompress request bodies sent with ``Content-Encoding: gzip``.
+
+    The security scanner gzips large finding payloads; Starlette does not
+    decode request bodies itself, so routes would otherwise see raw gzip.
+    """
+
+    def __init__(self, app, max_size: int = GZIP_REQUEST_MAX_BYTES,
+                 max_compressed_size: int = GZIP_REQUEST_MAX_COMPRESSED_BYTES):
+        self.app = app
+        self.max_size = max_size
+        self.max_compressed_size = max_compressed_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(
+            name == b"content-encoding" and value.strip().lower() == b"gzip"
+            for name, value in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        received = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if received > self.max_compressed_size:
+                await JSONResponse(status_code=413, content={"detail": "Request body too large"})(scope, receive, send)
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(b"".join(chunks), self.max_size + 1)
+        except zlib.error:
+            await JSONResponse(status_code=400, content={"detail": "Invalid gzip request body"})(scope, receive, send)
+            return
+        if len(body) > self.max_size:
+            await JSONResponse(status_code=413, content={"detail": "Request body too large"})(scope, receive, send)
+            return
+        # A truncated stream decompresses without error; so does one with trailing bytes
+        if not decompressor.eof or decompressor.unused_data:
+            await JSONResponse(status_code=400, content={"detail": "Invalid gzip request body"})(scope, receive, send)
+            return
+
+        headers = [
+            (name, value) for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(body)).encode()))
+        scope = dict(scope, headers=headers)
+
+        body_sent = False
+
+        async def receive_decompressed():
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, receive_decompressed, send)
+
+
+def configure_request_decompression(app):
+    """Accept gzip-encoded request bodies"""
+    app.add_middleware(GzipRequestMiddleware)
+
+
 def configure_exception_handlers(app):
     """Configure global exception handlers"""
     
@@ -91,6 +91,7 @@ def create_llm_router(deps: RouterDeps) -> APIRouter:
         try:
             deleted = await db.delete_llm_config()
 
+            await solution_engine.close()
             solution_engine.llm_provider = None
 
             if deleted:
@@ -104,6 +105,7 @@ def create_llm_router(deps: RouterDeps) -> APIRouter:
     @router.post("/admin/llm/test")
     async def test_llm_config(config: LLMConfigCreate):
         """Test LLM configuration without saving"""
+        provider = None
         try:
             from services.llm_factory import LLMFactory
 
@@ -128,5 +130,8 @@ def create_llm_router(deps: RouterDeps) -> APIRouter:
         except Exception as e:
             logger.error(f"Error testing LLM config: {e}")
             return {"success": False, "message": str(e)}
+        finally:
+            if provider:
+                await provider.close()
 
     return router
@@ -1,9 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import ValidationError
 import difflib
 import logging
 import traceback
 
-from models.models import SecurityFindingReport, SecurityFindingResponse
+from models.models import (
+    SecurityFindingBatchReport,
+    SecurityFindingReport,
+    SecurityFindingResourceBatchDelete,
+    SecurityFindingResponse,
+)
 from services.prometheus_metrics import SECURITY_FINDINGS_TOTAL
 from services.mirror_service import clean_manifest
 from .auth import require_write, require_service_token
@@ -11,6 +17,9 @@ from .deps import RouterDeps
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on findings accepted in one batch request
+SECURITY_FINDINGS_BATCH_MAX = 500
+
 
 def compute_manifest_diff(original: str, fixed: str) -> list:
     """Compute a structured diff between original and fixed manifests.
@@ -57,24 +66,28 @@ def create_security_ingest_router(deps: RouterDeps) -> APIRouter:
     db = deps.db
     websocket_manager = deps.websocket_manager
 
+    async def save_finding(report: SecurityFindingReport) -> SecurityFindingResponse:
+        """Persist one finding, broadcasting it if new"""
+        if not report.resource_name or not report.namespace:
+            raise HTTPException(status_code=400, detail="Resource name and namespace are required")
+
+        response = SecurityFindingResponse(**report.dict())
+        finding_id, is_new = await db.save_security_finding(response)
+        response.id = finding_id
+
+        if is_new:
+            await websocket_manager.broadcast_security_finding(response)
+
+        SECURITY_FINDINGS_TOTAL.labels(severity=report.severity).inc()
+        return response
+
     @router.post("/security/findings", response_model=SecurityFindingResponse)
     async def report_security_finding(report: SecurityFindingReport):
         """Receive security finding report from scanner agent"""
         logger.info(f"Received security finding for {report.resource_type}/{report.namespace}/{report.resource_name}")
 
         try:
-            if not report.resource_name or not report.namespace:
-                raise HTTPException(status_code=400, detail="Resource name and namespace are required")
-
-            response = SecurityFindingResponse(**report.dict())
-            finding_id, is_new = await db.save_security_finding(response)
-            response.id = finding_id
-
-            if is_new:
-                await websocket_manager.broadcast_security_finding(response)
-
-            SECURITY_FINDINGS_TOTAL.labels(severity=report.severity).inc()
-            return response
+            return await save_finding(report)
 
         except HTTPException:
             raise
@@ -85,6 +98,36 @@ def create_security_ingest_router(deps: RouterDeps) -> APIRouter:
             logger.error(f"Error details: {traceback.format_exc()}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    @router.post("/security/findings/batch")
+    async def report_security_findings_batch(batch: SecurityFindingBatchReport):
+        """Receive a batch of security findings from the scanner agent.
+
+        Each finding is saved independently; failures are reported per item
+        by index instead of failing the whole batch.
+        """
+        if len(batch.findings) > SECURITY_FINDINGS_BATCH_MAX:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch exceeds {SECURITY_FINDINGS_BATCH_MAX} findings"
+            )
+
+        logger.info(f"Received batch of {len(batch.findings)} security findings")
+        saved = 0
+        errors = []
+        for index, item in enumerate(batch.findings):
+            try:
+                await save_finding(SecurityFindingReport.model_validate(item))
+                saved += 1
+            except ValidationError as e:
+                errors.append({"index": index, "detail": str(e)})
+            except HTTPException as e:
+                errors.append({"index": index, "detail": e.detail})
+            except Exception as e:
+                logger.error(f"Failed to process security finding {index} of batch: {e}")
+                errors.append({"index": index, "detail": str(e)})
+
+        return {"saved": saved, "errors": errors}
+
     @router.post("/security/scan/clear")
     async def clear_security_findings():
         """Clear all security findings (for new scans)"""
@@ -110,6 +153,29 @@ def create_security_ingest_router(deps: RouterDeps) -> APIRouter:
             logger.error(f"Error deleting findings by resource: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    @router.post("/security/findings/resource/batch")
+    async def delete_findings_by_resources(batch: SecurityFindingResourceBatchDelete):
+        """Delete all security findings for several resources in one request"""
+        if len(batch.items) > SECURITY_FINDINGS_BATCH_MAX:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch exceeds {SECURITY_FINDINGS_BATCH_MAX} resources"
+            )
+
+        try:
+            count, deleted_findings = await db.delete_findings_by_resources(
+                [(item.resource_type, item.namespace, item.resource_name) for item in batch.items]
+            )
+            logger.info(f"Deleted {count} findings for {len(batch.items)} resources")
+
+            for finding in deleted_findings:
+                await websocket_manager.broadcast_security_finding_deleted(finding)
+
+            return {"message": f"Deleted {count} findings for {len(batch.items)} resources", "count": count}
+        except Exception as e:
+            logger.error(f"Error deleting findings by resources: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
     @router.post("/security/rescan-status")
     async def report_security_rescan_status(data: dict):
         """Report security rescan status from scanner (started/completed)"""
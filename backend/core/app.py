@@ -14,7 +14,7 @@ from services.notification_service import NotificationService
 from services.mirror_service import MirrorService
 from api.routes import create_api_router
 from api.auth import get_service_token, get_session_secret
-from api.middleware import configure_cors, configure_exception_handlers
+from api.middleware import configure_cors, configure_exception_handlers, configure_request_decompression
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +87,8 @@ def create_app() -> FastAPI:
             await cleanup_task
         except asyncio.CancelledError:
             pass
+        await notification_service.close()
+        await solution_engine.close()
         await db.close()
 
     # Create FastAPI app
@@ -94,6 +96,7 @@ def create_app() -> FastAPI:
 
     # Configure middleware and exception handlers
     configure_cors(app)
+    configure_request_decompression(app)
     configure_exception_handlers(app)
 
     # Health check endpoint (outside of API router for compatibility)
@@ -2,9 +2,11 @@
 
 import os
 
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
 
 def _env_bool(name: str, default: str = "true") -> bool:
-    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+    return os.getenv(name, default).strip().lower() in _TRUTHY
 
 
 # Feature flag controlling whether previous-container failure logs sent
@@ -75,6 +75,9 @@ class Database:
     async def delete_findings_by_resource(self, resource_type, namespace, resource_name):
         return await self._db.delete_findings_by_resource(resource_type, namespace, resource_name)
 
+    async def delete_findings_by_resources(self, resources):
+        return await self._db.delete_findings_by_resources(resources)
+
     async def close(self):
         return await self._db.close()
 
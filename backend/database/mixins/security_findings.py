@@ -150,6 +150,27 @@ class SecurityFindingMixin:
             count = int(result.split()[-1]) if result else 0
             return count, deleted_findings
 
+    async def delete_findings_by_resources(self, resources: list[tuple[str, str, str]]) -> tuple[int, list]:
+        """Delete all findings for several (resource_type, namespace, resource_name)
+        resources in one statement. Returns (count, deleted_findings)."""
+        if not resources:
+            return 0, []
+        resource_types, namespaces, resource_names = (list(column) for column in zip(*resources))
+        async with self._acquire() as conn:
+            rows = await conn.fetch(
+                """DELETE FROM security_findings f
+                   USING unnest($1::text[], $2::text[], $3::text[]) AS r(resource_type, namespace, resource_name)
+                   WHERE f.resource_type = r.resource_type AND f.namespace = r.namespace
+                     AND f.resource_name = r.resource_name
+                   RETURNING f.resource_name, f.namespace, f.title""",
+                resource_types, namespaces, resource_names
+            )
+            deleted_findings = [
+                {"resource_name": row['resource_name'], "namespace": row['namespace'], "title": row['title']}
+                for row in rows
+            ]
+            return len(deleted_findings), deleted_findings
+
     async def delete_findings_by_namespace(self, namespace: str) -> tuple[int, list]:
         """Delete all security findings for a namespace and return deleted findings"""
         async with self._acquire() as conn:
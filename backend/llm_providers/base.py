@@ -1,8 +1,33 @@
+import aiohttp
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 
+# Output-format guidance appended to every pod failure prompt
+_RESPONSE_FORMAT_INSTRUCTIONS = """Please provide a clear, well-formatted response. Use proper line breaks and formatting:
+
+## What's Wrong
+Explain the issue in simple terms.
+
+## How to Fix It
+1. First step - clear explanation
+2. Second step - clear explanation  
+3. Additional steps as needed
+
+## Prevention Tips
+- Key prevention measure 1
+- Key prevention measure 2
+- Additional tips as needed
+
+## Useful Commands
+- `kubectl describe pod <pod-name>` - Shows detailed pod status
+- `kubectl logs <pod-name>` - Shows container logs
+- Additional relevant commands
+
+IMPORTANT: Use proper line breaks between sections and list items. Keep explanations clear and concise."""
+
+
 @dataclass
 class LLMResponse:
     """Response from LLM provider"""
@@ -21,6 +46,21 @@ class LLMProvider(ABC):
         self.model = model or self.default_model
         if base_url is not None:
             self.base_url = base_url
+        # Shared across calls so repeat requests reuse the warm TLS connection
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
     
     @property
     @abstractmethod
@@ -64,53 +104,37 @@ class LLMProvider(ABC):
         pod_context: Dict = None
     ) -> str:
         """Build the prompt for the LLM"""
-        prompt = f"""You are a Kubernetes expert helping to diagnose and fix pod failures.
+        lines = [
+            "You are a Kubernetes expert helping to diagnose and fix pod failures.",
+            "",
+            "Pod Failure Details:",
+            f"- Failure Reason: {failure_reason}",
+        ]
 
-Pod Failure Details:
-- Failure Reason: {failure_reason}"""
-        
         if failure_message:
-            prompt += f"\n- Failure Message: {failure_message}"
-        
+            lines.append(f"- Failure Message: {failure_message}")
+
         if pod_context:
-            prompt += f"\n- Pod Name: {pod_context.get('name', 'Unknown')}"
-            prompt += f"\n- Namespace: {pod_context.get('namespace', 'Unknown')}"
-            prompt += f"\n- Image: {pod_context.get('image', 'Unknown')}"
-        
+            lines.append(f"- Pod Name: {pod_context.get('name', 'Unknown')}")
+            lines.append(f"- Namespace: {pod_context.get('namespace', 'Unknown')}")
+            lines.append(f"- Image: {pod_context.get('image', 'Unknown')}")
+
         if events:
-            prompt += "\n\nRecent Events:"
+            lines.append("")
+            lines.append("Recent Events:")
             for event in events[-5:]:  # Last 5 events
-                prompt += f"\n- {event.get('type', 'Unknown')} {event.get('reason', '')}: {event.get('message', '')}"
-        
+                lines.append(f"- {event.get('type', 'Unknown')} {event.get('reason', '')}: {event.get('message', '')}")
+
         if container_statuses:
-            prompt += "\n\nContainer Statuses:"
+            lines.append("")
+            lines.append("Container Statuses:")
             for status in container_statuses:
-                prompt += f"\n- {status.get('name', 'Unknown')}: restart_count={status.get('restart_count', 0)}"
+                entry = f"- {status.get('name', 'Unknown')}: restart_count={status.get('restart_count', 0)}"
                 if status.get('last_state'):
-                    prompt += f", last_state={status['last_state']}"
-        
-        prompt += """
-
-Please provide a clear, well-formatted response. Use proper line breaks and formatting:
-
-## What's Wrong
-Explain the issue in simple terms.
+                    entry += f", last_state={status['last_state']}"
+                lines.append(entry)
 
-## How to Fix It
-1. First step - clear explanation
-2. Second step - clear explanation  
-3. Additional steps as needed
+        lines.append("")
+        lines.append(_RESPONSE_FORMAT_INSTRUCTIONS)
 
-## Prevention Tips
-- Key prevention measure 1
-- Key prevention measure 2
-- Additional tips as needed
-
-## Useful Commands
-- `kubectl describe pod <pod-name>` - Shows detailed pod status
-- `kubectl logs <pod-name>` - Shows container logs
-- Additional relevant commands
-
-IMPORTANT: Use proper line breaks between sections and list items. Keep explanations clear and concise."""
-        
-        return prompt
\ No newline at end of file
+        return "\n".join(lines)
\ No newline at end of file
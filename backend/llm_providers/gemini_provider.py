@@ -1,4 +1,3 @@
-import aiohttp
 import logging
 from typing import Dict, List, Optional
 from .base import LLMProvider, LLMResponse
@@ -51,27 +50,27 @@ class GeminiProvider(LLMProvider):
         url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    headers={"Content-Type": "application/json"},
-                    json=payload
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Gemini API error {response.status}: {error_text}")
-                        raise Exception(f"Gemini API error: {response.status}")
-
-                    data = await response.json()
-                    content = data["candidates"][0]["content"]["parts"][0]["text"]
-                    tokens_used = data.get("usageMetadata", {}).get("totalTokenCount")
-
-                    return LLMResponse(
-                        content=content,
-                        provider=self.provider_name,
-                        model=self.model,
-                        tokens_used=tokens_used
-                    )
+            session = await self._get_session()
+            async with session.post(
+                url,
+                headers={"Content-Type": "application/json"},
+                json=payload
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Gemini API error {response.status}: {error_text}")
+                    raise Exception(f"Gemini API error: {response.status}")
+
+                data = await response.json()
+                content = data["candidates"][0]["content"]["parts"][0]["text"]
+                tokens_used = data.get("usageMetadata", {}).get("totalTokenCount")
+
+                return LLMResponse(
+                    content=content,
+                    provider=self.provider_name,
+                    model=self.model,
+                    tokens_used=tokens_used
+                )
 
         except Exception as e:
             logger.error(f"Error calling Gemini API: {e}")
@@ -98,27 +97,27 @@ class GeminiProvider(LLMProvider):
         url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    headers={"Content-Type": "application/json"},
-                    json=payload
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Gemini API error {response.status}: {error_text}")
-                        raise Exception(f"Gemini API error: {response.status}")
-
-                    data = await response.json()
-                    content = data["candidates"][0]["content"]["parts"][0]["text"]
-                    tokens_used = data.get("usageMetadata", {}).get("totalTokenCount")
-
-                    return LLMResponse(
-                        content=content,
-                        provider=self.provider_name,
-                        model=self.model,
-                        tokens_used=tokens_used
-                    )
+            session = await self._get_session()
+            async with session.post(
+                url,
+                headers={"Content-Type": "application/json"},
+                json=payload
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Gemini API error {response.status}: {error_text}")
+                    raise Exception(f"Gemini API error: {response.status}")
+
+                data = await response.json()
+                content = data["candidates"][0]["content"]["parts"][0]["text"]
+                tokens_used = data.get("usageMetadata", {}).get("totalTokenCount")
+
+                return LLMResponse(
+                    content=content,
+                    provider=self.provider_name,
+                    model=self.model,
+                    tokens_used=tokens_used
+                )
 
         except Exception as e:
             logger.error(f"Error calling Gemini API (generate_raw): {e}")
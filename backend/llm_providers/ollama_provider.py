@@ -1,4 +1,3 @@
-import aiohttp
 import logging
 from typing import Dict, List, Optional
 from .base import LLMProvider, LLMResponse
@@ -55,27 +54,27 @@ class OllamaProvider(LLMProvider):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Ollama API error {response.status}: {error_text}")
-                        raise Exception(f"Ollama API error: {response.status}")
-
-                    data = await response.json()
-                    content = data["choices"][0]["message"]["content"]
-                    tokens_used = data.get("usage", {}).get("total_tokens")
-
-                    return LLMResponse(
-                        content=content,
-                        provider=self.provider_name,
-                        model=self.model,
-                        tokens_used=tokens_used
-                    )
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/v1/chat/completions",
+                headers=headers,
+                json=payload
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Ollama API error {response.status}: {error_text}")
+                    raise Exception(f"Ollama API error: {response.status}")
+
+                data = await response.json()
+                content = data["choices"][0]["message"]["content"]
+                tokens_used = data.get("usage", {}).get("total_tokens")
+
+                return LLMResponse(
+                    content=content,
+                    provider=self.provider_name,
+                    model=self.model,
+                    tokens_used=tokens_used
+                )
 
         except Exception as e:
             logger.error(f"Error calling Ollama API: {e}")
@@ -98,27 +97,27 @@ class OllamaProvider(LLMProvider):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Ollama API error {response.status}: {error_text}")
-                        raise Exception(f"Ollama API error: {response.status}")
-
-                    data = await response.json()
-                    content = data["choices"][0]["message"]["content"]
-                    tokens_used = data.get("usage", {}).get("total_tokens")
-
-                    return LLMResponse(
-                        content=content,
-                        provider=self.provider_name,
-                        model=self.model,
-                        tokens_used=tokens_used
-                    )
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/v1/chat/completions",
+                headers=headers,
+                json=payload
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Ollama API error {response.status}: {error_text}")
+                    raise Exception(f"Ollama API error: {response.status}")
+
+                data = await response.json()
+                content = data["choices"][0]["message"]["content"]
+                tokens_used = data.get("usage", {}).get("total_tokens")
+
+                return LLMResponse(
+                    content=content,
+                    provider=self.provider_name,
+                    model=self.model,
+                    tokens_used=tokens_used
+                )
 
         except Exception as e:
             logger.error(f"Error calling Ollama API (generate_raw): {e}")
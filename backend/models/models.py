@@ -10,6 +10,7 @@ class ContainerStatus(BaseModel):
     reason: Optional[str] = None
     message: Optional[str] = None
     exit_code: Optional[int] = None
+    last_state: Optional[str] = None
 
 class PodEvent(BaseModel):
     type: str
@@ -97,6 +98,18 @@ class SecurityFindingResponse(SecurityFinding):
     id: Optional[int] = None
     dismissed: bool = False
 
+class SecurityFindingBatchReport(BaseModel):
+    # Items are validated one at a time so a malformed finding doesn't reject the whole batch
+    findings: List[Dict[str, Any]]
+
+class SecurityFindingResource(BaseModel):
+    resource_type: str
+    namespace: str
+    resource_name: str
+
+class SecurityFindingResourceBatchDelete(BaseModel):
+    items: List[SecurityFindingResource]
+
 
 # Admin models
 class ExcludedNamespace(BaseModel):
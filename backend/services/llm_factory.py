@@ -41,13 +41,14 @@ class LLMFactory:
         """Create an LLM provider instance"""
         provider_name = provider_name.lower()
 
-        if provider_name not in self.SUPPORTED_PROVIDERS:
+        # Aliases are entries of SUPPORTED_PROVIDERS, so one lookup resolves them
+        provider_class = self.SUPPORTED_PROVIDERS.get(provider_name)
+        if provider_class is None:
             raise ValueError(
                 f"Unsupported provider: {provider_name}. "
                 f"Supported providers: {list(self.SUPPORTED_PROVIDERS.keys())}"
             )
 
-        provider_class = self.SUPPORTED_PROVIDERS[provider_name]
         kwargs = {"api_key": api_key, "model": model}
         if base_url:
             kwargs["base_url"] = base_url
@@ -1,43 +1,88 @@
 import aiohttp
+import asyncio
 import logging
-from typing import Dict, Any
+import orjson
+from typing import Any, Awaitable, Callable, Dict, Optional
 from models.models import PodFailureResponse
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on webhook requests in flight for a single notification
+NOTIFICATION_MAX_CONCURRENCY = 4
+
+
+def _orjson_dumps(obj) -> str:
+    """JSON encoder for webhook payloads sent with ``json=``"""
+    return orjson.dumps(obj).decode()
+
 
 class NotificationService:
     """Service for sending notifications via various providers"""
 
     def __init__(self, db):
         self.db = db
+        # Shared across sends so repeat webhooks reuse warm keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Provider dispatch tables, bound once rather than on every send
+        self._handlers: Dict[str, Callable[..., Awaitable[None]]] = {
+            'slack': self._send_slack,
+            'teams': self._send_teams
+        }
+        self._resolved_handlers: Dict[str, Callable[..., Awaitable[None]]] = {
+            'slack': self._send_slack_resolved,
+            'teams': self._send_teams_resolved
+        }
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60),
+                json_serialize=_orjson_dumps,
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
 
     async def send_pod_failure_notification(self, failure: PodFailureResponse):
         """Send notification for a pod failure to all enabled providers"""
         try:
             settings = await self.db.get_enabled_notification_settings()
 
-            for setting in settings:
-                try:
-                    await self._send_notification(
-                        provider=setting.provider,
-                        config=setting.config,
-                        failure=failure
-                    )
-                    logger.info(f"Sent {setting.provider} notification for pod {failure.namespace}/{failure.pod_name}")
-                except Exception as e:
-                    logger.error(f"Failed to send {setting.provider} notification: {e}")
+            await self._send_to_all(
+                settings,
+                lambda setting: self._send_notification(
+                    provider=setting.provider,
+                    config=setting.config,
+                    failure=failure
+                ),
+                kind="notification",
+                target=f"{failure.namespace}/{failure.pod_name}",
+            )
         except Exception as e:
             logger.error(f"Error getting notification settings: {e}")
 
+    async def _send_to_all(self, settings, send: Callable[[Any], Awaitable[None]],
+                           kind: str, target: str):
+        """Send to every enabled provider concurrently; one failing webhook doesn't affect the rest"""
+        semaphore = asyncio.Semaphore(NOTIFICATION_MAX_CONCURRENCY)
+
+        async def send_one(setting):
+            async with semaphore:
+                try:
+                    await send(setting)
+                    logger.info(f"Sent {setting.provider} {kind} for pod {target}")
+                except Exception as e:
+                    logger.error(f"Failed to send {setting.provider} {kind}: {e}")
+
+        await asyncio.gather(*(send_one(setting) for setting in settings))
+
     async def _send_notification(self, provider: str, config: Dict[str, Any], failure: PodFailureResponse):
         """Route to appropriate provider handler"""
-        handlers = {
-            'slack': self._send_slack,
-            'teams': self._send_teams
-        }
-
-        handler = handlers.get(provider)
+        handler = self._handlers.get(provider)
         if handler:
             await handler(config, failure)
         else:
@@ -61,15 +106,15 @@ class NotificationService:
             }]
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                config['webhook_url'],
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise Exception(f"Slack webhook returned {response.status}: {text}")
+        session = await self._get_session()
+        async with session.post(
+            config['webhook_url'],
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status != 200:
+                text = await response.text()
+                raise Exception(f"Slack webhook returned {response.status}: {text}")
 
     async def _send_teams(self, config: Dict[str, Any], failure: PodFailureResponse):
         """Send Microsoft Teams notification via Power Automate Workflows webhook"""
@@ -132,44 +177,39 @@ class NotificationService:
             ]
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                config['webhook_url'],
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                # Workflows webhooks return 202 Accepted on success
-                if response.status not in (200, 202):
-                    text = await response.text()
-                    raise Exception(f"Teams webhook returned {response.status}: {text}")
+        session = await self._get_session()
+        async with session.post(
+            config['webhook_url'],
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            # Workflows webhooks return 202 Accepted on success
+            if response.status not in (200, 202):
+                text = await response.text()
+                raise Exception(f"Teams webhook returned {response.status}: {text}")
 
     async def send_pod_resolved_notification(self, namespace: str, pod_name: str):
         """Send notification when a pod failure is resolved/dismissed"""
         try:
             settings = await self.db.get_enabled_notification_settings()
 
-            for setting in settings:
-                try:
-                    await self._send_resolved_notification(
-                        provider=setting.provider,
-                        config=setting.config,
-                        namespace=namespace,
-                        pod_name=pod_name
-                    )
-                    logger.info(f"Sent {setting.provider} resolved notification for pod {namespace}/{pod_name}")
-                except Exception as e:
-                    logger.error(f"Failed to send {setting.provider} resolved notification: {e}")
+            await self._send_to_all(
+                settings,
+                lambda setting: self._send_resolved_notification(
+                    provider=setting.provider,
+                    config=setting.config,
+                    namespace=namespace,
+                    pod_name=pod_name
+                ),
+                kind="resolved notification",
+                target=f"{namespace}/{pod_name}",
+            )
         except Exception as e:
             logger.error(f"Error getting notification settings: {e}")
 
     async def _send_resolved_notification(self, provider: str, config: Dict[str, Any], namespace: str, pod_name: str):
         """Route to appropriate provider handler for resolved notifications"""
-        handlers = {
-            'slack': self._send_slack_resolved,
-            'teams': self._send_teams_resolved
-        }
-
-        handler = handlers.get(provider)
+        handler = self._resolved_handlers.get(provider)
         if handler:
             await handler(config, namespace, pod_name)
         else:
@@ -191,15 +231,15 @@ class NotificationService:
             }]
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                config['webhook_url'],
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    raise Exception(f"Slack webhook returned {response.status}: {text}")
+        session = await self._get_session()
+        async with session.post(
+            config['webhook_url'],
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status != 200:
+                text = await response.text()
+                raise Exception(f"Slack webhook returned {response.status}: {text}")
 
     async def _send_teams_resolved(self, config: Dict[str, Any], namespace: str, pod_name: str):
         """Send Microsoft Teams resolved notification via Power Automate Workflows webhook"""
@@ -248,15 +288,15 @@ class NotificationService:
             ]
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                config['webhook_url'],
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status not in (200, 202):
-                    text = await response.text()
-                    raise Exception(f"Teams webhook returned {response.status}: {text}")
+        session = await self._get_session()
+        async with session.post(
+            config['webhook_url'],
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            if response.status not in (200, 202):
+                text = await response.text()
+                raise Exception(f"Teams webhook returned {response.status}: {text}")
 
     async def test_notification(self, provider: str, config: Dict[str, Any]) -> bool:
         """Send a test notification to verify configuration"""
@@ -1,14 +1,203 @@
+import asyncio
+import hashlib
 import logging
 import re
 import time
-from typing import Dict, List, Optional
-from core.config import LLM_LOGS_TAIL_LINES, LLM_MANIFEST_MAX_BYTES
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+import orjson
+from core.config import (
+    LLM_LOGS_TAIL_LINES,
+    LLM_MANIFEST_MAX_BYTES,
+)
 from models.models import PodEvent, ContainerStatus
 from .llm_factory import LLMFactory
 from .prometheus_metrics import LLM_REQUESTS_TOTAL, LLM_REQUEST_DURATION_SECONDS
 
 logger = logging.getLogger(__name__)
 
+# Parsers for the structured "```yaml ... ``` ---EXPLANATION--- ..." LLM output
+_YAML_BLOCK_RE = re.compile(r'```ya?ml\s*\n(.*?)```', re.DOTALL)
+_EXPLANATION_RE = re.compile(r'---EXPLANATION---\s*\n(.*)\Z', re.DOTALL)
+
+_LOG_AWARE_SYSTEM_PROMPT = (
+    "You are a Kubernetes expert. Use the previous container logs as the "
+    "primary diagnostic signal. Identify the root cause of the failure from "
+    "the logs and propose a specific, actionable fix. Reference concrete "
+    "lines from the logs in your explanation. If the manifest is relevant "
+    "to the fix, cite the field(s) that need to change."
+)
+
+_POD_FIX_SYSTEM_PROMPT = """You are a Kubernetes expert. You will be given a Kubernetes Pod YAML manifest, a failure reason, events, and a suggested solution.
+Your task is to produce a FIXED version of the manifest that resolves the failure.
+
+Rules:
+- Return the COMPLETE fixed YAML manifest (not a partial patch)
+- Only change what is necessary to fix the SPECIFIC failure described
+- Do NOT modify metadata fields (name, namespace, labels, annotations) unless the failure is specifically about them
+- Do NOT change fields that are unrelated to the failure, even if they could be improved
+- Preserve all existing functionality
+- If the fix requires external action (e.g., creating a Secret, adding a node) that cannot be expressed in the manifest, still return the best possible manifest and explain what else is needed
+- Do NOT add comments to the YAML
+
+Output format (follow EXACTLY):
+```yaml
+<complete fixed manifest here>
+```
+---EXPLANATION---
+<brief explanation of what was changed and why, 2-4 sentences>"""
+
+_SECURITY_FIX_SYSTEM_PROMPT = """You are a Kubernetes security expert. You will be given a Kubernetes resource YAML manifest and a security finding.
+Your task is to produce a FIXED version of the manifest that resolves the security issue.
+
+Rules:
+- Return the COMPLETE fixed YAML manifest (not a partial patch)
+- Only change what is necessary to fix the SPECIFIC security issue described in the finding
+- Do NOT modify metadata fields (name, namespace, labels, annotations) unless the finding is specifically about them
+- Do NOT change fields that are unrelated to the security finding, even if they could be improved
+- Preserve all existing functionality
+- Use best practices from Pod Security Standards and NSA/CISA guidelines
+- Do NOT add comments to the YAML
+
+Output format (follow EXACTLY):
+```yaml
+<complete fixed manifest here>
+```
+---EXPLANATION---
+<brief explanation of what was changed and why, 2-4 sentences>"""
+
+
+# Upper bound on memoized fallback enhancement suffixes
+ENHANCEMENT_CACHE_MAX_ENTRIES = 256
+
+# Fallback enhancements keyed by failure reason and by Kubernetes event reason
+_REASON_HINTS: Mapping[str, str] = MappingProxyType({
+    'ImagePullBackOff': "Commands to check: 'kubectl describe pod <pod-name>' and 'docker pull <image>' on a node.",
+    'CrashLoopBackOff': "Commands: 'kubectl logs <pod-name> --previous' to see crash logs.",
+    'Pending': "Commands: 'kubectl describe pod <pod-name>' and 'kubectl get nodes' to check resources.",
+})
+_EVENT_REASON_HINTS: Mapping[str, str] = MappingProxyType({
+    'FailedScheduling': "Scheduling issue detected - check node capacity and pod requirements.",
+    'FailedMount': "Volume mount issue - verify PVC and volume configuration.",
+})
+
+# Shared stand-in for "no events / no statuses". A tuple rather than a list so
+# nothing downstream can accidentally append to the shared instance.
+_NO_ITEMS: tuple = ()
+
+
+def _events_to_dicts(events: list) -> List[Dict]:
+    """Convert PodEvent models (or plain dicts) to the dicts LLM prompts are built from."""
+    result = []
+    for event in events:
+        if isinstance(event, dict):
+            result.append({
+                "type": event.get("type", "Unknown"),
+                "reason": event.get("reason", ""),
+                "message": event.get("message", ""),
+            })
+        elif hasattr(event, "type"):
+            result.append({
+                "type": event.type,
+                "reason": event.reason,
+                "message": event.message,
+            })
+    return result
+
+
+def _statuses_to_dicts(container_statuses: list) -> List[Dict]:
+    """Convert ContainerStatus models (or plain dicts) to the dicts LLM prompts are built from."""
+    result = []
+    for status in container_statuses:
+        if isinstance(status, dict):
+            result.append({
+                "name": status.get("name", "Unknown"),
+                "restart_count": status.get("restart_count", 0),
+                "last_state": status.get("last_state"),
+            })
+        elif hasattr(status, "name"):
+            result.append({
+                "name": status.name,
+                "restart_count": status.restart_count,
+                "last_state": status.last_state,
+            })
+    return result
+
+
+def _freeze_solutions(solutions: Dict[str, Dict]) -> Mapping[str, Mapping]:
+    """Wrap the solution table read-only, adding a lowercased copy of each pattern table.
+
+    ``patterns_lower`` is a tuple of (lowercased pattern, solution) pairs, built once
+    here so the fallback matcher doesn't lowercase or go through dict views per call.
+    """
+    frozen = {}
+    for reason, solution_config in solutions.items():
+        solution_config = dict(solution_config)
+        if 'patterns' in solution_config:
+            solution_config['patterns_lower'] = tuple(
+                (pattern.lower(), solution)
+                for pattern, solution in solution_config['patterns'].items()
+            )
+            solution_config['patterns'] = MappingProxyType(solution_config['patterns'])
+        frozen[reason] = MappingProxyType(solution_config)
+    return MappingProxyType(frozen)
+
+
+# Hardcoded solutions for common Kubernetes pod issues (fallback). Built once at
+# import and shared read-only by every SolutionEngine.
+_SOLUTIONS: Mapping[str, Mapping] = _freeze_solutions({
+    'ImagePullBackOff': {
+        'default': 'The pod cannot pull the container image. Check: 1) Image name and tag are correct, 2) Image exists in the registry, 3) Registry credentials are properly configured, 4) Network connectivity to registry.',
+        'patterns': {
+            'repository does not exist': 'The image repository does not exist. Verify the image name and registry URL.',
+            'pull access denied': 'Insufficient permissions to pull image. Check if imagePullSecrets are configured correctly.',
+            'not found': 'Image or tag not found. Verify the image name and tag exist in the registry.'
+        }
+    },
+    'ErrImagePull': {
+        'default': 'Error pulling container image. Verify: 1) Image name syntax is correct, 2) Registry is accessible, 3) Authentication credentials if needed.',
+    },
+    'CrashLoopBackOff': {
+        'default': 'Container is crashing repeatedly. Check: 1) Application logs for errors, 2) Resource limits (CPU/Memory), 3) Environment variables and configuration, 4) Health check configuration.',
+        'patterns': {
+            'exit code 125': 'Container failed to start. Check container configuration and command syntax.',
+            'exit code 126': 'Container command not executable. Verify file permissions and executable path.',
+            'exit code 127': 'Container command not found. Check if the command exists in the container.',
+            'OOMKilled': 'Container killed due to out of memory. Increase memory limits or optimize application memory usage.'
+        }
+    },
+    'Pending': {
+        'default': 'Pod is stuck in pending state. Check: 1) Node resources (CPU/Memory), 2) Node selectors and taints, 3) Persistent volume availability, 4) Image pull issues.',
+        'patterns': {
+            'Insufficient cpu': 'Not enough CPU resources available. Scale cluster or reduce resource requests.',
+            'Insufficient memory': 'Not enough memory available. Scale cluster or reduce memory requests.',
+            'No nodes available': 'No suitable nodes found. Check node selectors, taints, and tolerations.',
+            'pod has unbound immediate PersistentVolumeClaims': 'Missing persistent volume. Create PV or check storage class configuration.',
+            'FailedScheduling': 'Scheduler cannot place pod. Check node resources, taints/tolerations, and node selectors.'
+        }
+    },
+    'FailedScheduling': {
+        'default': 'Pod cannot be scheduled to any node. Check: 1) Node resources (CPU/Memory), 2) Node selectors match available nodes, 3) Tolerations match node taints, 4) Affinity rules are satisfiable.',
+        'patterns': {
+            'Insufficient cpu': 'Not enough CPU resources on nodes. Scale cluster, reduce resource requests, or wait for other pods to complete.',
+            'Insufficient memory': 'Not enough memory on nodes. Scale cluster, reduce memory requests, or wait for other pods to complete.',
+            'node(s) didn\'t match Pod\'s node affinity': 'No nodes match the pod\'s node selector or affinity rules. Update selectors or add matching nodes.',
+            'node(s) had taint': 'Nodes have taints that pod does not tolerate. Add tolerations to pod spec or remove taints from nodes.',
+            'persistentvolumeclaim': 'PVC not bound. Check PVC status and ensure storage class/PV is available.',
+            '0/': 'No nodes available for scheduling. Check if nodes are Ready and have sufficient resources.'
+        }
+    },
+    'CreateContainerConfigError': {
+        'default': 'Error creating container configuration. Check: 1) ConfigMap and Secret references, 2) Volume mount configurations, 3) Environment variable references.',
+    },
+    'InvalidImageName': {
+        'default': 'Invalid container image name format. Verify image name follows registry/repository:tag format.',
+    },
+    'Error': {
+        'default': 'Pod is in error state. Check pod events and logs for specific error details.',
+    }
+})
+
 
 class SolutionEngine:
     def __init__(self, db=None):
@@ -16,63 +205,10 @@ class SolutionEngine:
         self._db = db
         # Initialize LLM provider (will be set up properly after db init)
         self.llm_provider = None
-        # Initialize hardcoded solutions dictionary
-        self._init_solutions()
-
-    def _init_solutions(self):
-        """Initialize hardcoded solutions for common Kubernetes pod issues (fallback)"""
-        self.solutions = {
-            'ImagePullBackOff': {
-                'default': 'The pod cannot pull the container image. Check: 1) Image name and tag are correct, 2) Image exists in the registry, 3) Registry credentials are properly configured, 4) Network connectivity to registry.',
-                'patterns': {
-                    'repository does not exist': 'The image repository does not exist. Verify the image name and registry URL.',
-                    'pull access denied': 'Insufficient permissions to pull image. Check if imagePullSecrets are configured correctly.',
-                    'not found': 'Image or tag not found. Verify the image name and tag exist in the registry.'
-                }
-            },
-            'ErrImagePull': {
-                'default': 'Error pulling container image. Verify: 1) Image name syntax is correct, 2) Registry is accessible, 3) Authentication credentials if needed.',
-            },
-            'CrashLoopBackOff': {
-                'default': 'Container is crashing repeatedly. Check: 1) Application logs for errors, 2) Resource limits (CPU/Memory), 3) Environment variables and configuration, 4) Health check configuration.',
-                'patterns': {
-                    'exit code 125': 'Container failed to start. Check container configuration and command syntax.',
-                    'exit code 126': 'Container command not executable. Verify file permissions and executable path.',
-                    'exit code 127': 'Container command not found. Check if the command exists in the container.',
-                    'OOMKilled': 'Container killed due to out of memory. Increase memory limits or optimize application memory usage.'
-                }
-            },
-            'Pending': {
-                'default': 'Pod is stuck in pending state. Check: 1) Node resources (CPU/Memory), 2) Node selectors and taints, 3) Persistent volume availability, 4) Image pull issues.',
-                'patterns': {
-                    'Insufficient cpu': 'Not enough CPU resources available. Scale cluster or reduce resource requests.',
-                    'Insufficient memory': 'Not enough memory available. Scale cluster or reduce memory requests.',
-                    'No nodes available': 'No suitable nodes found. Check node selectors, taints, and tolerations.',
-                    'pod has unbound immediate PersistentVolumeClaims': 'Missing persistent volume. Create PV or check storage class configuration.',
-                    'FailedScheduling': 'Scheduler cannot place pod. Check node resources, taints/tolerations, and node selectors.'
-                }
-            },
-            'FailedScheduling': {
-                'default': 'Pod cannot be scheduled to any node. Check: 1) Node resources (CPU/Memory), 2) Node selectors match available nodes, 3) Tolerations match node taints, 4) Affinity rules are satisfiable.',
-                'patterns': {
-                    'Insufficient cpu': 'Not enough CPU resources on nodes. Scale cluster, reduce resource requests, or wait for other pods to complete.',
-                    'Insufficient memory': 'Not enough memory on nodes. Scale cluster, reduce memory requests, or wait for other pods to complete.',
-                    'node(s) didn\'t match Pod\'s node affinity': 'No nodes match the pod\'s node selector or affinity rules. Update selectors or add matching nodes.',
-                    'node(s) had taint': 'Nodes have taints that pod does not tolerate. Add tolerations to pod spec or remove taints from nodes.',
-                    'persistentvolumeclaim': 'PVC not bound. Check PVC status and ensure storage class/PV is available.',
-                    '0/': 'No nodes available for scheduling. Check if nodes are Ready and have sufficient resources.'
-                }
-            },
-            'CreateContainerConfigError': {
-                'default': 'Error creating container configuration. Check: 1) ConfigMap and Secret references, 2) Volume mount configurations, 3) Environment variable references.',
-            },
-            'InvalidImageName': {
-                'default': 'Invalid container image name format. Verify image name follows registry/repository:tag format.',
-            },
-            'Error': {
-                'default': 'Pod is in error state. Check pod events and logs for specific error details.',
-            }
-        }
+        # In-flight LLM calls by request key, shared by concurrent identical requests
+        self._pending_solutions: Dict[str, asyncio.Future] = {}
+        # Fallback "Additional info" suffixes keyed by (reason, high restarts, event reasons)
+        self._enhancement_cache: Dict[Tuple, str] = {}
 
     async def initialize(self):
         """Initialize the LLM provider from database configuration"""
@@ -95,17 +231,25 @@ class SolutionEngine:
     async def reinitialize_llm(self, provider: str, api_key: str, model: str = None, base_url: str = None):
         """Reinitialize the LLM provider with new configuration"""
         try:
+            previous = self.llm_provider
             self.llm_provider = LLMFactory.create_provider(
                 provider_name=provider,
                 api_key=api_key,
                 model=model,
                 base_url=base_url
             )
+            if previous:
+                await previous.close()
             logger.info(f"LLM provider reinitialized: {provider}")
         except Exception as e:
             logger.error(f"Failed to reinitialize LLM provider: {e}")
             raise
 
+    async def close(self):
+        """Release the LLM provider's HTTP session"""
+        if self.llm_provider:
+            await self.llm_provider.close()
+
     async def get_solution(self, reason: str, message: Optional[str] = None,
                      events: List[PodEvent] = None,
                      container_statuses: List[ContainerStatus] = None,
@@ -115,62 +259,77 @@ class SolutionEngine:
 
         # Try LLM first if available
         if use_llm and self.llm_provider:
-            provider_name = self.llm_provider.provider_name
-            start_time = time.monotonic()
-            try:
-                logger.info(f"Generating AI solution for {reason} using {provider_name}")
-
-                # Convert events to dict format for LLM
-                events_dict = []
-                if events:
-                    events_dict = [
-                        {
-                            "type": event.type,
-                            "reason": event.reason,
-                            "message": event.message
-                        }
-                        for event in events
-                    ]
-
-                # Convert container statuses to dict format
-                container_statuses_dict = []
-                if container_statuses:
-                    container_statuses_dict = [
-                        {
-                            "name": status.name,
-                            "restart_count": status.restart_count,
-                            "last_state": getattr(status, 'last_state', None)
-                        }
-                        for status in container_statuses
-                    ]
-
-                llm_response = await self.llm_provider.generate_solution(
-                    failure_reason=reason,
-                    failure_message=message,
-                    events=events_dict,
-                    container_statuses=container_statuses_dict,
-                    pod_context=pod_context
-                )
+            # Convert events and container statuses to dict format for LLM
+            events_dict = _events_to_dicts(events) if events else _NO_ITEMS
+            container_statuses_dict = _statuses_to_dicts(container_statuses) if container_statuses else _NO_ITEMS
 
-                # Record success metrics
-                duration = time.monotonic() - start_time
-                LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="success").inc()
-                LLM_REQUEST_DURATION_SECONDS.labels(provider=provider_name).observe(duration)
+            request_key = self._solution_request_key(
+                reason, message, events_dict, container_statuses_dict, pod_context
+            )
 
-                return llm_response.content
+            # Identical requests made while one is in flight (e.g. a double-clicked
+            # retry) wait for that call instead of making their own; every waiter
+            # gets its result or its exception.
+            pending = self._pending_solutions.get(request_key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._generate_llm_solution(
+                    reason, message, events_dict, container_statuses_dict, pod_context
+                ))
+                self._pending_solutions[request_key] = pending
+                pending.add_done_callback(
+                    lambda task: self._pending_solutions.pop(request_key, None)
+                )
 
+            try:
+                return await asyncio.shield(pending)
             except Exception as e:
-                # Record error metrics
-                duration = time.monotonic() - start_time
-                LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="error").inc()
-                LLM_REQUEST_DURATION_SECONDS.labels(provider=provider_name).observe(duration)
-
                 logger.error(f"LLM solution generation failed: {e}, falling back to hardcoded solutions")
-        
+
         # Fallback to hardcoded solutions
         fallback_solution = self._get_fallback_solution(reason, message, events, container_statuses)
         return f"AI solution temporarily unavailable. Here's basic troubleshooting:\n\n{fallback_solution}"
 
+    async def _generate_llm_solution(self, reason: str, message: Optional[str],
+                                     events: List[Dict], container_statuses: List[Dict],
+                                     pod_context: Optional[Dict]) -> str:
+        """Call the LLM provider once, recording request metrics"""
+        provider_name = self.llm_provider.provider_name
+        start_time = time.monotonic()
+        try:
+            logger.info(f"Generating AI solution for {reason} using {provider_name}")
+
+            llm_response = await self.llm_provider.generate_solution(
+                failure_reason=reason,
+                failure_message=message,
+                events=events,
+                container_statuses=container_statuses,
+                pod_context=pod_context
+            )
+        except Exception:
+            # Record error metrics
+            duration = time.monotonic() - start_time
+            LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="error").inc()
+            LLM_REQUEST_DURATION_SECONDS.labels(provider=provider_name).observe(duration)
+            raise
+
+        # Record success metrics
+        duration = time.monotonic() - start_time
+        LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="success").inc()
+        LLM_REQUEST_DURATION_SECONDS.labels(provider=provider_name).observe(duration)
+
+        return llm_response.content
+
+    @staticmethod
+    def _solution_request_key(reason: str, message: Optional[str], events: List[Dict],
+                            container_statuses: List[Dict], pod_context: Optional[Dict]) -> str:
+        """Content-addressed key over every input the LLM prompt is built from"""
+        signature = orjson.dumps(
+            [reason, message, events, container_statuses, pod_context],
+            default=str,
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.blake2b(signature, digest_size=16).hexdigest()
+
     async def get_log_aware_solution(
         self,
         reason: str,
@@ -198,45 +357,8 @@ class SolutionEngine:
         start_time = time.monotonic()
 
         # Normalize events / container_statuses into list-of-dict form
-        events_dict: List[Dict] = []
-        if events:
-            for event in events:
-                if isinstance(event, dict):
-                    events_dict.append({
-                        "type": event.get("type", "Unknown"),
-                        "reason": event.get("reason", ""),
-                        "message": event.get("message", ""),
-                    })
-                elif hasattr(event, "type"):
-                    events_dict.append({
-                        "type": event.type,
-                        "reason": event.reason,
-                        "message": event.message,
-                    })
-
-        statuses_dict: List[Dict] = []
-        if container_statuses:
-            for status in container_statuses:
-                if isinstance(status, dict):
-                    statuses_dict.append({
-                        "name": status.get("name", "Unknown"),
-                        "restart_count": status.get("restart_count", 0),
-                        "last_state": status.get("last_state"),
-                    })
-                elif hasattr(status, "name"):
-                    statuses_dict.append({
-                        "name": status.name,
-                        "restart_count": status.restart_count,
-                        "last_state": getattr(status, "last_state", None),
-                    })
-
-        system_prompt = (
-            "You are a Kubernetes expert. Use the previous container logs as the "
-            "primary diagnostic signal. Identify the root cause of the failure from "
-            "the logs and propose a specific, actionable fix. Reference concrete "
-            "lines from the logs in your explanation. If the manifest is relevant "
-            "to the fix, cite the field(s) that need to change."
-        )
+        events_dict = _events_to_dicts(events) if events else _NO_ITEMS
+        statuses_dict = _statuses_to_dicts(container_statuses) if container_statuses else _NO_ITEMS
 
         user_prompt = self._build_log_aware_prompt(
             reason=reason,
@@ -249,7 +371,7 @@ class SolutionEngine:
         )
 
         try:
-            llm_response = await self.llm_provider.generate_raw(system_prompt, user_prompt)
+            llm_response = await self.llm_provider.generate_raw(_LOG_AWARE_SYSTEM_PROMPT, user_prompt)
             duration = time.monotonic() - start_time
             LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="success").inc()
             LLM_REQUEST_DURATION_SECONDS.labels(provider=provider_name).observe(duration)
@@ -360,14 +482,14 @@ class SolutionEngine:
         """Generate fallback solution using hardcoded rules"""
         
         # Get base solution
-        if reason in self.solutions:
-            solution_config = self.solutions[reason]
+        solution_config = _SOLUTIONS.get(reason)
+        if solution_config is not None:
             solution = solution_config['default']
 
             # Check for pattern-specific solutions
-            if 'patterns' in solution_config:
-                pattern_solution = self._find_pattern_solution(
-                    solution_config['patterns'], message, events
+            if 'patterns_lower' in solution_config:
+                pattern_solution = self._find_lowered_pattern_solution(
+                    solution_config['patterns_lower'], message, events
                 )
                 if pattern_solution:
                     solution = pattern_solution
@@ -385,17 +507,20 @@ class SolutionEngine:
                                message: Optional[str],
                                events: List[PodEvent]) -> Optional[str]:
         """Find specific solution based on error message patterns"""
-        search_text = ""
-
-        if message:
-            search_text += message.lower()
+        lowered = tuple((pattern.lower(), solution) for pattern, solution in patterns.items())
+        return self._find_lowered_pattern_solution(lowered, message, events)
 
+    def _find_lowered_pattern_solution(self, patterns: Tuple[Tuple[str, str], ...],
+                                       message: Optional[str],
+                                       events: List[PodEvent]) -> Optional[str]:
+        """Like _find_pattern_solution, for (lowercased pattern, solution) pairs"""
+        parts = [message] if message else []
         if events:
-            for event in events:
-                search_text += f" {event.message.lower()}"
+            parts.extend(event.message for event in events)
+        search_text = " ".join(parts).lower()
 
-        for pattern, solution in patterns.items():
-            if pattern.lower() in search_text:
+        for pattern, solution in patterns:
+            if pattern in search_text:
                 return solution
 
         return None
@@ -405,40 +530,52 @@ class SolutionEngine:
                                        events: List[PodEvent],
                                        container_statuses: List[ContainerStatus]) -> str:
         """Add context-specific enhancements to the solution"""
-        enhancements = []
+        # The suffix only depends on the reason, the event reasons and (for crash
+        # loops) which containers restarted often, so repeat failures reuse it.
+        high_restarts = ()
+        if reason == 'CrashLoopBackOff' and container_statuses:
+            high_restarts = tuple(
+                (status.name, status.restart_count)
+                for status in container_statuses
+                if status.restart_count > 5
+            )
+        key = (reason, high_restarts, tuple(event.reason for event in events) if events else ())
 
-        # Add specific commands or checks based on context
-        if reason == 'ImagePullBackOff':
-            enhancements.append(
-                "Commands to check: 'kubectl describe pod <pod-name>' and 'docker pull <image>' on a node.")
+        suffix = self._enhancement_cache.get(key)
+        if suffix is None:
+            suffix = self._build_enhancement_suffix(reason, high_restarts, key[2])
+            if len(self._enhancement_cache) >= ENHANCEMENT_CACHE_MAX_ENTRIES:
+                # FIFO eviction: dicts keep insertion order
+                del self._enhancement_cache[next(iter(self._enhancement_cache))]
+            self._enhancement_cache[key] = suffix
+
+        return base_solution + suffix
 
-        elif reason == 'CrashLoopBackOff':
-            enhancements.append("Commands: 'kubectl logs <pod-name> --previous' to see crash logs.")
+    @staticmethod
+    def _build_enhancement_suffix(reason: str, high_restarts: Tuple, event_reasons: Tuple) -> str:
+        """Build the pre-joined " Additional info: ..." suffix (empty if nothing applies)"""
+        enhancements = []
 
-            # Check for high restart count
-            if container_statuses:
-                for status in container_statuses:
-                    if status.restart_count > 5:
-                        enhancements.append(
-                            f"Container '{status.name}' has restarted {status.restart_count} times - investigate application startup issues.")
+        # Add specific commands or checks based on context
+        reason_hint = _REASON_HINTS.get(reason)
+        if reason_hint:
+            enhancements.append(reason_hint)
 
-        elif reason == 'Pending':
+        # Only populated for CrashLoopBackOff
+        for name, restart_count in high_restarts:
             enhancements.append(
-                "Commands: 'kubectl describe pod <pod-name>' and 'kubectl get nodes' to check resources.")
+                f"Container '{name}' has restarted {restart_count} times - investigate application startup issues.")
 
         # Add event-based enhancements
-        if events:
-            for event in events:
-                if 'FailedScheduling' in event.reason:
-                    enhancements.append("Scheduling issue detected - check node capacity and pod requirements.")
-                elif 'FailedMount' in event.reason:
-                    enhancements.append("Volume mount issue - verify PVC and volume configuration.")
+        for event_reason in event_reasons:
+            event_hint = _EVENT_REASON_HINTS.get(event_reason)
+            if event_hint:
+                enhancements.append(event_hint)
 
-        # Combine base solution with enhancements
         if enhancements:
-            return base_solution + " Additional info: " + " ".join(enhancements)
+            return " Additional info: " + " ".join(enhancements)
 
-        return base_solution
+        return ""
 
     async def generate_pod_fix(self, manifest: str, failure_reason: str, failure_message: str,
                                events: list, solution: str) -> dict:
@@ -454,25 +591,6 @@ class SolutionEngine:
                 'is_fallback': True
             }
 
-        system_prompt = """You are a Kubernetes expert. You will be given a Kubernetes Pod YAML manifest, a failure reason, events, and a suggested solution.
-Your task is to produce a FIXED version of the manifest that resolves the failure.
-
-Rules:
-- Return the COMPLETE fixed YAML manifest (not a partial patch)
-- Only change what is necessary to fix the SPECIFIC failure described
-- Do NOT modify metadata fields (name, namespace, labels, annotations) unless the failure is specifically about them
-- Do NOT change fields that are unrelated to the failure, even if they could be improved
-- Preserve all existing functionality
-- If the fix requires external action (e.g., creating a Secret, adding a node) that cannot be expressed in the manifest, still return the best possible manifest and explain what else is needed
-- Do NOT add comments to the YAML
-
-Output format (follow EXACTLY):
-```yaml
-<complete fixed manifest here>
-```
----EXPLANATION---
-<brief explanation of what was changed and why, 2-4 sentences>"""
-
         user_prompt = f"""Pod Failure Details:
 - Failure Reason: {failure_reason}
 - Failure Message: {failure_message or 'N/A'}
@@ -494,7 +612,7 @@ Please provide the fixed manifest and explanation."""
             provider_name = self.llm_provider.provider_name
             start_time = time.monotonic()
 
-            llm_response = await self.llm_provider.generate_raw(system_prompt, user_prompt)
+            llm_response = await self.llm_provider.generate_raw(_POD_FIX_SYSTEM_PROMPT, user_prompt)
 
             duration = time.monotonic() - start_time
             LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="success").inc()
@@ -506,12 +624,12 @@ Please provide the fixed manifest and explanation."""
             explanation = ''
 
             # Extract YAML block
-            yaml_match = re.search(r'```ya?ml\s*\n(.*?)```', content, re.DOTALL)
+            yaml_match = _YAML_BLOCK_RE.search(content)
             if yaml_match:
                 fixed_manifest = yaml_match.group(1).strip()
 
             # Extract explanation
-            explanation_match = re.search(r'---EXPLANATION---\s*\n(.*?)$', content, re.DOTALL)
+            explanation_match = _EXPLANATION_RE.search(content)
             if explanation_match:
                 explanation = explanation_match.group(1).strip()
             elif not yaml_match:
@@ -560,25 +678,6 @@ Please provide the fixed manifest and explanation."""
                 'is_fallback': True
             }
 
-        system_prompt = """You are a Kubernetes security expert. You will be given a Kubernetes resource YAML manifest and a security finding.
-Your task is to produce a FIXED version of the manifest that resolves the security issue.
-
-Rules:
-- Return the COMPLETE fixed YAML manifest (not a partial patch)
-- Only change what is necessary to fix the SPECIFIC security issue described in the finding
-- Do NOT modify metadata fields (name, namespace, labels, annotations) unless the finding is specifically about them
-- Do NOT change fields that are unrelated to the security finding, even if they could be improved
-- Preserve all existing functionality
-- Use best practices from Pod Security Standards and NSA/CISA guidelines
-- Do NOT add comments to the YAML
-
-Output format (follow EXACTLY):
-```yaml
-<complete fixed manifest here>
-```
----EXPLANATION---
-<brief explanation of what was changed and why, 2-4 sentences>"""
-
         user_prompt = f"""Security Finding:
 - Title: {title}
 - Severity: {severity}
@@ -597,7 +696,7 @@ Please provide the fixed manifest and explanation."""
             provider_name = self.llm_provider.provider_name
             start_time = time.monotonic()
 
-            llm_response = await self.llm_provider.generate_raw(system_prompt, user_prompt)
+            llm_response = await self.llm_provider.generate_raw(_SECURITY_FIX_SYSTEM_PROMPT, user_prompt)
 
             duration = time.monotonic() - start_time
             LLM_REQUESTS_TOTAL.labels(provider=provider_name, status="success").inc()
@@ -609,12 +708,12 @@ Please provide the fixed manifest and explanation."""
             explanation = remediation
 
             # Extract YAML block
-            yaml_match = re.search(r'```ya?ml\s*\n(.*?)```', content, re.DOTALL)
+            yaml_match = _YAML_BLOCK_RE.search(content)
             if yaml_match:
                 fixed_manifest = yaml_match.group(1).strip()
 
             # Extract explanation
-            explanation_match = re.search(r'---EXPLANATION---\s*\n(.*?)$', content, re.DOTALL)
+            explanation_match = _EXPLANATION_RE.search(content)
             if explanation_match:
                 explanation = explanation_match.group(1).strip()
             elif not yaml_match:
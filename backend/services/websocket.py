@@ -1,8 +1,8 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 import asyncio
-import json
 import logging
-from typing import List, Optional
+import orjson
+from typing import Dict, Optional, Set
 from api.auth import SESSION_COOKIE_NAME, validate_ws_auth
 from models.models import PodFailureResponse, SecurityFindingResponse
 from services.prometheus_metrics import WEBSOCKET_CONNECTIONS_ACTIVE
@@ -10,78 +10,115 @@ from services.prometheus_metrics import WEBSOCKET_CONNECTIONS_ACTIVE
 logger = logging.getLogger(__name__)
 
 
+# Per-client backlog of pending messages; a client this far behind is dropped
+SEND_QUEUE_MAXSIZE = 256
+
+
 class WebSocketManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        self._send_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        # Keeps close tasks for dropped clients alive until they finish
+        self._closing: Set[asyncio.Task] = set()
         self.router = APIRouter()
         self.router.websocket("/ws")(self.websocket_endpoint)
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_MAXSIZE)
+        self._send_queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+        self.active_connections.add(websocket)
         WEBSOCKET_CONNECTIONS_ACTIVE.inc()
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        if websocket not in self.active_connections:
+            return
+        self.active_connections.discard(websocket)
+        self._send_queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         WEBSOCKET_CONNECTIONS_ACTIVE.dec()
         logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
-    async def _broadcast(self, message_type: str, data, description: str = None, parallel: bool = False):
+    def _drop(self, websocket: WebSocket):
+        """Disconnect a client that cannot keep up and close its socket so it reconnects."""
+        self.disconnect(websocket)
+        task = asyncio.create_task(self._close(websocket))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, websocket: WebSocket):
+        """Close a dropped client's socket, ignoring errors from an already-dead connection."""
+        try:
+            # 1013 "Try Again Later": agents and scanners reconnect on close
+            await asyncio.wait_for(websocket.close(code=1013), timeout=10.0)
+        except Exception as e:
+            logger.debug(f"Error closing dropped WebSocket client: {e}")
+
+    async def _send(self, connection: WebSocket, serialized: str, desc: str) -> bool:
+        """Send a pre-serialized message to one client. Returns False on failure."""
+        try:
+            await asyncio.wait_for(connection.send_text(serialized), timeout=10.0)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout sending {desc} to WebSocket client")
+        except Exception as e:
+            logger.warning(f"Failed to send {desc} to WebSocket: {e}")
+        return False
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Deliver queued messages to one client in order, one send at a time."""
+        while True:
+            serialized, desc = await queue.get()
+            try:
+                success = await self._send(websocket, serialized, desc)
+            finally:
+                queue.task_done()
+            if not success:
+                self._drop(websocket)
+                return
+
+    async def _broadcast(self, message_type: str, data, description: str = None):
         """Generic broadcast to all connected WebSocket clients.
 
+        The message is serialized once and queued for each client's writer
+        task, so broadcasters never wait on the network and a slow client
+        cannot hold up the others. Clients whose queue is full are dropped.
+
         Args:
             message_type: The message type string sent to clients.
-            data: The payload (dict, list, or Pydantic model with .dict()).
+            data: The payload (dict, list, or Pydantic model).
             description: Human-readable label for log messages. Defaults to message_type.
-            parallel: If True, send to all clients concurrently with timeouts.
         """
         if not self.active_connections:
             return
 
         desc = description or message_type
 
-        if hasattr(data, 'dict'):
+        if hasattr(data, 'model_dump'):
+            data = data.model_dump(mode="json")
+        elif hasattr(data, 'dict'):
             data = data.dict()
 
-        if parallel:
-            serialized = json.dumps({"type": message_type, "data": data}, default=str)
-
-            async def send_to_client(connection):
-                try:
-                    await asyncio.wait_for(connection.send_text(serialized), timeout=10.0)
-                    return True, connection
-                except asyncio.TimeoutError:
-                    logger.warning(f"Timeout sending {desc} to WebSocket client")
-                    return False, connection
-                except Exception as e:
-                    logger.warning(f"Failed to send {desc} to WebSocket: {e}")
-                    return False, connection
-
-            results = await asyncio.gather(
-                *[send_to_client(conn) for conn in self.active_connections],
-                return_exceptions=True,
-            )
-
-            disconnected = []
-            for result in results:
-                if isinstance(result, tuple):
-                    success, conn = result
-                    if not success:
-                        disconnected.append(conn)
-        else:
-            message = {"type": message_type, "data": data}
-            disconnected = []
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(json.dumps(message, default=str))
-                except Exception as e:
-                    logger.warning(f"Failed to send {desc} to WebSocket: {e}")
-                    disconnected.append(connection)
-
-        for conn in disconnected:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+        # Encode once with orjson; decode to str because clients expect text frames.
+        # default=str only fires for exotic values in plain-dict payloads.
+        serialized = orjson.dumps(
+            {"type": message_type, "data": data},
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+        # Snapshot since disconnect() below mutates the set
+        for connection in list(self.active_connections):
+            try:
+                self._send_queues[connection].put_nowait((serialized, desc))
+            except asyncio.QueueFull:
+                logger.warning(f"Send queue full, dropping WebSocket client (while sending {desc})")
+                self._drop(connection)
 
     # --- Pod broadcasts ---
 
@@ -152,7 +189,6 @@ class WebSocketManager:
             "trusted_registry_change",
             {"registry": registry, "action": action},
             description="trusted registry change",
-            parallel=True,
         )
 
     async def broadcast_security_rescan_request(self):
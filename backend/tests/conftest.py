@@ -2,11 +2,13 @@ import pytest
 import pytest_asyncio
 import asyncio
 import os
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, Mock
 from httpx import AsyncClient, ASGITransport
 from fastapi import FastAPI
 
 from database.database import Database
+from models.models import PodFailureResponse
 from services.solution_engine import SolutionEngine
 from services.websocket import WebSocketManager
 from api.routes import create_api_router
@@ -25,45 +27,83 @@ DATABASE_AVAILABLE = bool(os.getenv('DATABASE_URL'))
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for session scope"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def mock_failure():
+    """Pod failure response shared read-only by every test that needs one"""
+    return PodFailureResponse(
+        id=1,
+        pod_name="test-pod",
+        namespace="default",
+        node_name="test-node",
+        phase="Pending",
+        creation_timestamp="2025-01-01T00:00:00Z",
+        failure_reason="ImagePullBackOff",
+        failure_message="Failed to pull image",
+        container_statuses=[],
+        events=[],
+        logs="",
+        manifest="",
+        solution="Test solution",
+        timestamp="2025-01-01T00:00:00Z",
+        dismissed=False
+    )
 
 
-@pytest_asyncio.fixture
-async def test_db():
-    """Create test database - PostgreSQL only"""
+@pytest_asyncio.fixture(scope="session")
+async def database():
+    """Initialize the PostgreSQL test database once for the whole session"""
     if not DATABASE_AVAILABLE:
         pytest.skip("DATABASE_URL not set - skipping database tests")
 
-    reset_auth_cache()
     db = Database()
     await db.init_database()
-
-    # Clean auth-related tables between tests so the setup flow can be re-exercised.
-    try:
-        pg_db = db._db  # unwrap Database -> PostgreSQLDatabase
-        async with pg_db._acquire() as conn:
-            await conn.execute("TRUNCATE invitations RESTART IDENTITY CASCADE")
-            await conn.execute("TRUNCATE users RESTART IDENTITY CASCADE")
-            await conn.execute(
-                "DELETE FROM app_settings WHERE key IN ('service_token', 'session_secret')"
-            )
-    except Exception:
-        # Tables may not exist on very first run; init_database would have created them.
-        pass
-
-    reset_auth_cache()
-
     yield db
     await db.close()
 
 
 @pytest_asyncio.fixture
-async def app(test_db):
-    """Create test app with test database.
+async def test_db(database):
+    """Create test database - PostgreSQL only.
+
+    Every query the test makes runs on one connection inside a transaction
+    that is rolled back afterwards, so tests leave no rows behind.
+    """
+    reset_auth_cache()
+
+    pg_db = database._db  # unwrap Database -> PostgreSQLDatabase
+    conn = await pg_db.pool.acquire()
+    transaction = conn.transaction()
+    try:
+        await transaction.start()
+
+        @asynccontextmanager
+        async def _acquire_test_connection():
+            yield conn
+
+        pg_db._acquire = _acquire_test_connection
+
+        # Clean auth-related tables so the setup flow can be re-exercised.
+        await conn.execute("TRUNCATE invitations RESTART IDENTITY CASCADE")
+        await conn.execute("TRUNCATE users RESTART IDENTITY CASCADE")
+        await conn.execute(
+            "DELETE FROM app_settings WHERE key IN ('service_token', 'session_secret')"
+        )
+
+        yield database
+    finally:
+        pg_db.__dict__.pop("_acquire", None)
+        try:
+            # Bounded: a test that drove the app from another event loop (Starlette's
+            # TestClient) can leave the connection stuck mid-query.
+            await asyncio.wait_for(transaction.rollback(), timeout=5)
+        except Exception:
+            conn.terminate()
+        await pg_db.pool.release(conn)
+        reset_auth_cache()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def app(database):
+    """Create test app with test database, shared by the whole session.
 
     For legacy test compatibility we override auth dependencies so most
     callers can hit endpoints without managing cookies/tokens. Auth-specific
@@ -83,7 +123,7 @@ async def app(test_db):
     # Create FastAPI app
     test_app = FastAPI()
     configure_cors(test_app)
-    test_app.state.db = test_db
+    test_app.state.db = database
 
     # Health check endpoint
     @test_app.get("/health")
@@ -92,7 +132,7 @@ async def app(test_db):
 
     # Create API router with test database and mock solution engine
     api_router = create_api_router(
-        db=test_db,
+        db=database,
         solution_engine=mock_solution_engine,
         websocket_manager=websocket_manager,
         notification_service=None
@@ -114,12 +154,19 @@ async def app(test_db):
     return test_app
 
 
-@pytest_asyncio.fixture
-async def client(app):
-    """Create test client"""
+@pytest_asyncio.fixture(scope="session")
+async def shared_client(app):
+    """Create a test client whose transport is reused by every test"""
     if not DATABASE_AVAILABLE:
         pytest.skip("DATABASE_URL not set - skipping API tests")
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+@pytest_asyncio.fixture
+async def client(shared_client, test_db):
+    """Shared test client whose requests run inside the test's rolled-back
+    transaction, with auth tables and cache reset by test_db"""
+    yield shared_client
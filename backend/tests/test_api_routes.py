@@ -98,3 +98,71 @@ async def test_invalid_pod_data(client: AsyncClient):
 
     response = await client.post("/api/pods/failed", json=invalid_pod_data)
     assert response.status_code == 422  # Validation error
+
+
+@pytest.mark.asyncio
+async def test_report_security_findings_batch(client: AsyncClient):
+    """Test a batch saves valid findings and reports bad ones by index"""
+    import uuid
+    unique_id = uuid.uuid4().hex[:8]
+
+    finding = {
+        "resource_type": "Pod",
+        "resource_name": f"batch-pod-{unique_id}",
+        "namespace": "default",
+        "severity": "high",
+        "category": "Security",
+        "title": "Privileged container",
+        "description": "Container runs privileged",
+        "remediation": "Drop privileged",
+        "timestamp": "2025-01-01T00:00:00Z",
+    }
+    findings = [
+        finding,
+        {**finding, "title": "Host network enabled"},
+        {"resource_type": "Pod"},
+        {**finding, "namespace": ""},
+    ]
+
+    response = await client.post("/api/security/findings/batch", json={"findings": findings})
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["saved"] == 2
+    assert [error["index"] for error in result["errors"]] == [2, 3]
+
+    stored = (await client.get("/api/security/findings")).json()
+    titles = {f["title"] for f in stored if f["resource_name"] == f"batch-pod-{unique_id}"}
+    assert titles == {"Privileged container", "Host network enabled"}
+
+
+@pytest.mark.asyncio
+async def test_delete_findings_by_resources_batch(client: AsyncClient):
+    """Test one batch request removes the findings of every listed resource"""
+    import uuid
+    unique_id = uuid.uuid4().hex[:8]
+
+    finding = {
+        "resource_type": "Pod",
+        "namespace": "default",
+        "severity": "high",
+        "category": "Security",
+        "title": "Privileged container",
+        "description": "Container runs privileged",
+        "remediation": "Drop privileged",
+        "timestamp": "2025-01-01T00:00:00Z",
+    }
+    names = [f"gone-{unique_id}-{i}" for i in range(3)]
+    await client.post(
+        "/api/security/findings/batch",
+        json={"findings": [{**finding, "resource_name": name} for name in names]}
+    )
+
+    items = [{"resource_type": "Pod", "namespace": "default", "resource_name": name} for name in names[:2]]
+    response = await client.post("/api/security/findings/resource/batch", json={"items": items})
+    assert response.status_code == 200
+    assert response.json()["count"] == 2
+
+    stored = (await client.get("/api/security/findings")).json()
+    remaining = {f["resource_name"] for f in stored if f["resource_name"] in names}
+    assert remaining == {names[2]}
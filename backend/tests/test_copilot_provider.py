@@ -78,14 +78,12 @@ class TestCopilotProviderRequests:
 
         post_ctx = _mock_chat_completion_response(content="solution body")
         session = MagicMock()
+        session.closed = False
         session.post = MagicMock(return_value=post_ctx)
-        session_ctx = MagicMock()
-        session_ctx.__aenter__ = AsyncMock(return_value=session)
-        session_ctx.__aexit__ = AsyncMock(return_value=False)
 
         with patch(
-            "llm_providers.openai_provider.aiohttp.ClientSession",
-            return_value=session_ctx,
+            "llm_providers.base.aiohttp.ClientSession",
+            return_value=session,
         ):
             result = await provider.generate_solution(
                 failure_reason="CrashLoopBackOff",
@@ -119,14 +117,12 @@ class TestCopilotProviderRequests:
 
         post_ctx = _mock_chat_completion_response(content="raw body")
         session = MagicMock()
+        session.closed = False
         session.post = MagicMock(return_value=post_ctx)
-        session_ctx = MagicMock()
-        session_ctx.__aenter__ = AsyncMock(return_value=session)
-        session_ctx.__aexit__ = AsyncMock(return_value=False)
 
         with patch(
-            "llm_providers.openai_provider.aiohttp.ClientSession",
-            return_value=session_ctx,
+            "llm_providers.base.aiohttp.ClientSession",
+            return_value=session,
         ):
             result = await provider.generate_raw(
                 system_prompt="system",
@@ -155,16 +151,38 @@ class TestCopilotProviderRequests:
         post_ctx.__aexit__ = AsyncMock(return_value=False)
 
         session = MagicMock()
+        session.closed = False
         session.post = MagicMock(return_value=post_ctx)
-        session_ctx = MagicMock()
-        session_ctx.__aenter__ = AsyncMock(return_value=session)
-        session_ctx.__aexit__ = AsyncMock(return_value=False)
 
         with patch(
-            "llm_providers.openai_provider.aiohttp.ClientSession",
-            return_value=session_ctx,
+            "llm_providers.base.aiohttp.ClientSession",
+            return_value=session,
         ):
             with pytest.raises(Exception):
                 await provider.generate_solution(
                     failure_reason="CrashLoopBackOff",
                 )
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_one_session(self):
+        """Repeat calls share the provider's session until close()."""
+        provider = CopilotProvider(api_key="ghp_test-token")
+
+        session = MagicMock()
+        session.closed = False
+        session.close = AsyncMock()
+        session.post = MagicMock(
+            side_effect=lambda *args, **kwargs: _mock_chat_completion_response()
+        )
+
+        with patch(
+            "llm_providers.base.aiohttp.ClientSession",
+            return_value=session,
+        ) as session_class:
+            await provider.generate_raw(system_prompt="s", user_prompt="u")
+            await provider.generate_raw(system_prompt="s", user_prompt="u")
+            await provider.close()
+
+        assert session_class.call_count == 1
+        assert session.post.call_count == 2
+        session.close.assert_awaited_once()
@@ -0,0 +1,95 @@
+import gzip
+import os
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from api.middleware import GzipRequestMiddleware
+
+
+@pytest.fixture
+def app():
+    test_app = FastAPI()
+    test_app.add_middleware(GzipRequestMiddleware, max_size=1024, max_compressed_size=512)
+
+    @test_app.post("/echo")
+    async def echo(request: Request):
+        return {
+            "body": await request.json(),
+            "content_length": request.headers.get("content-length"),
+            "content_encoding": request.headers.get("content-encoding"),
+        }
+
+    return test_app
+
+
+@pytest.mark.asyncio
+async def test_gzip_request_body_is_decompressed(app):
+    payload = b'{"findings": ["a", "b"]}'
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/echo",
+            content=gzip.compress(payload),
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "body": {"findings": ["a", "b"]},
+        "content_length": str(len(payload)),
+        "content_encoding": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_plain_request_body_passes_through(app):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/echo", json={"ok": True})
+
+    assert response.status_code == 200
+    assert response.json()["body"] == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_invalid_gzip_body_is_rejected(app):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/echo", content=b"not gzip", headers={"Content-Encoding": "gzip"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_oversized_gzip_body_is_rejected(app):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/echo",
+            content=gzip.compress(b"0" * 4096),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_truncated_gzip_body_is_rejected(app):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/echo",
+            content=gzip.compress(b'{"findings": ["a", "b"]}')[:-8],
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_oversized_compressed_body_is_rejected(app):
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/echo",
+            content=gzip.compress(os.urandom(600)),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 413
@@ -1,7 +1,11 @@
+import asyncio
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
+import pytest_asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from services.notification_service import NotificationService
-from models.models import PodFailureResponse
 
 
 class TestNotificationService:
@@ -18,27 +22,6 @@ class TestNotificationService:
         """Create NotificationService instance with mocked db"""
         return NotificationService(mock_db)
 
-    @pytest.fixture
-    def mock_failure(self):
-        """Create mock pod failure response"""
-        return PodFailureResponse(
-            id=1,
-            pod_name="test-pod",
-            namespace="default",
-            node_name="test-node",
-            phase="Pending",
-            creation_timestamp="2025-01-01T00:00:00Z",
-            failure_reason="ImagePullBackOff",
-            failure_message="Failed to pull image",
-            container_statuses=[],
-            events=[],
-            logs="",
-            manifest="",
-            solution="Test solution",
-            timestamp="2025-01-01T00:00:00Z",
-            dismissed=False
-        )
-
     @pytest.mark.asyncio
     async def test_discord_not_supported(self, notification_service, mock_failure):
         """Test that Discord provider logs a warning (not supported)"""
@@ -60,69 +43,73 @@ class TestNotificationService:
             mock_logger.warning.assert_called_once()
             assert 'unknown_provider' in str(mock_logger.warning.call_args)
 
+    @pytest_asyncio.fixture
+    async def webhook_server(self):
+        """Local HTTP server standing in for Slack/Teams webhooks; records each request body"""
+        received = []
+        reply = {"status": 200, "text": "ok"}
+
+        async def handle(request):
+            received.append(await request.json())
+            return web.Response(**reply)
+
+        app = web.Application()
+        app.router.add_post("/webhook", handle)
+        server = TestServer(app)
+        await server.start_server()
+        yield str(server.make_url("/webhook")), received, reply
+        await server.close()
+
     @pytest.mark.asyncio
-    async def test_send_slack_notification(self, notification_service, mock_failure):
+    async def test_send_slack_notification(self, notification_service, mock_failure, webhook_server):
         """Test sending Slack notification"""
+        url, received, _ = webhook_server
         config = {
-            'webhook_url': 'https://hooks.slack.com/services/test',
+            'webhook_url': url,
             'channel': '#alerts'
         }
 
-        with patch('services.notification_service.aiohttp.ClientSession') as mock_session:
-            # Create proper async context manager mocks
-            mock_response = AsyncMock()
-            mock_response.status = 200
-
-            mock_post_cm = AsyncMock()
-            mock_post_cm.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_post_cm.__aexit__ = AsyncMock(return_value=None)
-
-            mock_session_instance = AsyncMock()
-            mock_session_instance.post = Mock(return_value=mock_post_cm)
-
-            mock_session_cm = AsyncMock()
-            mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-            mock_session.return_value = mock_session_cm
-
+        try:
             # Should not raise
             await notification_service._send_slack(config, mock_failure)
+        finally:
+            await notification_service.close()
+
+        assert received[0]["attachments"][0]["title"] == "Pod Failure: default/test-pod"
 
     @pytest.mark.asyncio
-    async def test_send_teams_notification(self, notification_service, mock_failure):
+    async def test_send_teams_notification(self, notification_service, mock_failure, webhook_server):
         """Test sending Microsoft Teams notification via Power Automate Workflows"""
-        config = {
-            'webhook_url': 'https://prod-00.westus.logic.azure.com:443/workflows/test'
-        }
-
-        with patch('services.notification_service.aiohttp.ClientSession') as mock_session:
-            # Create proper async context manager mocks
-            # Workflows webhooks return 202 Accepted on success
-            mock_response = AsyncMock()
-            mock_response.status = 202
+        url, received, reply = webhook_server
+        config = {'webhook_url': url}
+        # Workflows webhooks return 202 Accepted on success
+        reply["status"] = 202
 
-            mock_post_cm = AsyncMock()
-            mock_post_cm.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_post_cm.__aexit__ = AsyncMock(return_value=None)
+        try:
+            # Should not raise
+            await notification_service._send_teams(config, mock_failure)
+        finally:
+            await notification_service.close()
 
-            mock_session_instance = AsyncMock()
-            mock_session_instance.post = Mock(return_value=mock_post_cm)
+        assert received[0]["type"] == "message"
 
-            mock_session_cm = AsyncMock()
-            mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-            mock_session.return_value = mock_session_cm
+    @pytest.mark.asyncio
+    async def test_send_slack_notification_error_status(self, notification_service, mock_failure, webhook_server):
+        """Test a non-200 Slack response is raised with its body"""
+        url, _, reply = webhook_server
+        reply.update(status=404, text="no_service")
 
-            # Should not raise
-            await notification_service._send_teams(config, mock_failure)
+        try:
+            with pytest.raises(Exception, match="404: no_service"):
+                await notification_service._send_slack({'webhook_url': url}, mock_failure)
+        finally:
+            await notification_service.close()
 
     @pytest.mark.asyncio
     async def test_send_pod_failure_notification(self, notification_service, mock_failure, mock_db):
         """Test sending pod failure notification to all enabled providers"""
         # Setup mock settings
-        mock_setting = Mock()
-        mock_setting.provider = 'slack'
-        mock_setting.config = {'webhook_url': 'https://hooks.slack.com/test'}
+        mock_setting = SimpleNamespace(provider='slack', config={'webhook_url': 'https://hooks.slack.com/test'})
         mock_db.get_enabled_notification_settings.return_value = [mock_setting]
 
         with patch.object(notification_service, '_send_notification', new_callable=AsyncMock) as mock_send:
@@ -132,3 +119,51 @@ class TestNotificationService:
                 config={'webhook_url': 'https://hooks.slack.com/test'},
                 failure=mock_failure
             )
+
+    @pytest.mark.asyncio
+    async def test_send_pod_failure_notification_fans_out(self, notification_service, mock_failure, mock_db):
+        """Test every provider is sent to concurrently and one failure doesn't stop the others"""
+        slack = SimpleNamespace(provider='slack', config={'webhook_url': 'https://hooks.slack.com/test'})
+        teams = SimpleNamespace(provider='teams', config={'webhook_url': 'https://example.com/workflows/test'})
+        mock_db.get_enabled_notification_settings.return_value = [slack, teams]
+
+        in_flight = 0
+        peak = 0
+
+        async def send(provider, config, failure):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if provider == 'slack':
+                raise Exception("webhook down")
+
+        with patch.object(notification_service, '_send_notification', side_effect=send) as mock_send:
+            await notification_service.send_pod_failure_notification(mock_failure)
+
+        assert mock_send.await_count == 2
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_until_closed(self, notification_service):
+        """Test sends share one HTTP session and close() releases it"""
+        first = await notification_service._get_session()
+        second = await notification_service._get_session()
+        assert first is second
+
+        await notification_service.close()
+        assert first.closed
+
+        third = await notification_service._get_session()
+        assert third is not first
+        await notification_service.close()
+
+    @pytest.mark.asyncio
+    async def test_session_serializes_payloads_with_orjson(self, notification_service):
+        """Test webhook payloads are encoded with the orjson serializer"""
+        session = await notification_service._get_session()
+        try:
+            assert session.json_serialize({"text": "Pod Failure: default/web"}) == '{"text":"Pod Failure: default/web"}'
+        finally:
+            await notification_service.close()
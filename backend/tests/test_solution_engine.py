@@ -1,6 +1,9 @@
+import asyncio
 import pytest
+from unittest.mock import AsyncMock, Mock
 from services.solution_engine import SolutionEngine
 from models.models import PodEvent, ContainerStatus
+from llm_providers.base import LLMResponse
 
 
 class TestSolutionEngine:
@@ -11,60 +14,46 @@ class TestSolutionEngine:
         return SolutionEngine()
 
     @pytest.mark.asyncio
-    async def test_get_solution_image_pull_backoff(self, solution_engine):
-        """Test solution generation for ImagePullBackOff"""
-        reason = "ImagePullBackOff"
-        message = "Failed to pull image 'nonexistent:latest'"
-        
-        solution = await solution_engine.get_solution(reason, message)
-        
-        assert solution is not None
-        assert len(solution) > 0
-        assert "image" in solution.lower()
-
-    @pytest.mark.asyncio
-    async def test_get_solution_crash_loop_backoff(self, solution_engine):
-        """Test solution generation for CrashLoopBackOff"""
-        reason = "CrashLoopBackOff"
-        message = "Container crashed with exit code 1"
-        
-        container_status = ContainerStatus(
-            name="test-container",
-            ready=False,
-            restart_count=5,
-            image="test:latest",
-            state="waiting",
-            reason="CrashLoopBackOff",
-            message="Container crashed with exit code 1",
-            exit_code=1
-        )
-        
-        solution = await solution_engine.get_solution(
-            reason, message, container_statuses=[container_status]
-        )
-        
-        assert solution is not None
-        assert "restart" in solution.lower() or "crash" in solution.lower()
-
-    @pytest.mark.asyncio
-    async def test_get_solution_with_events(self, solution_engine):
-        """Test solution generation with pod events"""
-        reason = "Pending"
-        message = "Pod is pending"
-        
-        events = [
-            PodEvent(
+    @pytest.mark.parametrize("reason, message, kwargs, keywords", [
+        (
+            "ImagePullBackOff",
+            "Failed to pull image 'nonexistent:latest'",
+            {},
+            ("image",),
+        ),
+        (
+            "CrashLoopBackOff",
+            "Container crashed with exit code 1",
+            {"container_statuses": [ContainerStatus(
+                name="test-container",
+                ready=False,
+                restart_count=5,
+                image="test:latest",
+                state="waiting",
+                reason="CrashLoopBackOff",
+                message="Container crashed with exit code 1",
+                exit_code=1
+            )]},
+            ("restart", "crash"),
+        ),
+        (
+            "Pending",
+            "Pod is pending",
+            {"events": [PodEvent(
                 type="Warning",
                 reason="FailedMount",
                 message="MountVolume.SetUp failed: secret 'test' not found",
                 timestamp="2025-01-01T00:00:00Z"
-            )
-        ]
-        
-        solution = await solution_engine.get_solution(reason, message, events=events)
-        
-        assert solution is not None
-        assert "secret" in solution.lower() or "mount" in solution.lower()
+            )]},
+            ("secret", "mount"),
+        ),
+    ], ids=["image_pull_backoff", "crash_loop_backoff", "with_events"])
+    async def test_get_solution(self, solution_engine, reason, message, kwargs, keywords):
+        """Test solution generation per failure reason, with statuses and events"""
+        solution = await solution_engine.get_solution(reason, message, **kwargs)
+
+        assert solution
+        assert any(keyword in solution.lower() for keyword in keywords)
 
     def test_fallback_solution(self, solution_engine):
         """Test fallback solution for unknown failure"""
@@ -90,6 +79,14 @@ class TestSolutionEngine:
         
         assert solution == "Resource not found solution"
 
+    def test_find_pattern_solution_mixed_case_keys(self, solution_engine):
+        """Test caller-supplied pattern keys match regardless of case"""
+        patterns = {"OOMKilled": "Out of memory solution"}
+
+        solution = solution_engine._find_pattern_solution(patterns, "container was oomkilled", [])
+
+        assert solution == "Out of memory solution"
+
     def test_enhance_solution_with_context(self, solution_engine):
         """Test solution enhancement with context"""
         base_solution = "Basic pod failure solution"
@@ -100,4 +97,147 @@ class TestSolutionEngine:
         )
         
         assert "kubectl describe pod" in enhanced
-        assert "docker pull" in enhanced
\ No newline at end of file
+        assert "docker pull" in enhanced
+
+    def test_enhance_solution_with_event_reasons(self, solution_engine):
+        """Test event reasons add their hints and unknown reasons add nothing"""
+        events = [
+            PodEvent(type="Warning", reason=reason, message="", timestamp="2025-01-01T00:00:00Z")
+            for reason in ("FailedScheduling", "FailedMount", "BackOff")
+        ]
+
+        enhanced = solution_engine._enhance_solution_with_context(
+            "Base.", "Pending", None, events, []
+        )
+        plain = solution_engine._enhance_solution_with_context(
+            "Base.", "UnknownFailure", None, [], []
+        )
+
+        assert "kubectl get nodes" in enhanced
+        assert "Scheduling issue detected" in enhanced
+        assert "Volume mount issue" in enhanced
+        assert plain == "Base."
+
+    def test_fallback_solution_mixed_case_pattern(self, solution_engine):
+        """Mixed-case pattern keys still match case-insensitively"""
+        solution = solution_engine._get_fallback_solution(
+            "CrashLoopBackOff", "Last state: terminated (oomkilled)"
+        )
+
+        assert "out of memory" in solution
+
+    def test_enhancement_reflects_restart_counts(self, solution_engine):
+        """Test cached enhancements still reflect each container's restart count"""
+        def status(restart_count):
+            return ContainerStatus(
+                name="app", ready=False, restart_count=restart_count,
+                image="app:latest", state="waiting"
+            )
+
+        first = solution_engine._enhance_solution_with_context(
+            "Base.", "CrashLoopBackOff", None, [], [status(6)]
+        )
+        second = solution_engine._enhance_solution_with_context(
+            "Base.", "CrashLoopBackOff", None, [], [status(9)]
+        )
+        repeat = solution_engine._enhance_solution_with_context(
+            "Other base.", "CrashLoopBackOff", None, [], [status(6)]
+        )
+
+        assert "restarted 6 times" in first
+        assert "restarted 9 times" in second
+        assert repeat == "Other base." + first[len("Base."):]
+
+    def test_solution_table_is_read_only(self):
+        """Test the shared hardcoded solution table cannot be mutated"""
+        from services.solution_engine import _SOLUTIONS
+
+        with pytest.raises(TypeError):
+            _SOLUTIONS['ImagePullBackOff']['patterns']['new pattern'] = 'solution'
+
+
+class TestSolutionCoalescing:
+
+    @pytest.fixture
+    def solution_engine(self):
+        """Create SolutionEngine with a mocked LLM provider"""
+        engine = SolutionEngine()
+        engine.llm_provider = Mock()
+        engine.llm_provider.provider_name = "openai"
+        engine.llm_provider.generate_solution = AsyncMock(return_value=LLMResponse(
+            content="AI solution", provider="openai", model="gpt-4.1-mini"
+        ))
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_each_call_llm(self, solution_engine):
+        """Test a finished request is not reused by the next identical one"""
+        await solution_engine.get_solution("ImagePullBackOff", "pull access denied")
+        await solution_engine.get_solution("ImagePullBackOff", "pull access denied")
+
+        assert solution_engine.llm_provider.generate_solution.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_for_different_pods_not_shared(self, solution_engine):
+        """Test an answer naming one pod is not handed to another pod"""
+        async def slow_llm(**kwargs):
+            await asyncio.sleep(0.01)
+            return LLMResponse(content="AI solution", provider="openai", model="gpt-4.1-mini")
+
+        solution_engine.llm_provider.generate_solution.side_effect = slow_llm
+
+        await asyncio.gather(*[
+            solution_engine.get_solution(
+                "ImagePullBackOff", "pull access denied",
+                pod_context={"name": name, "namespace": "prod", "image": "web:1.0"}
+            )
+            for name in ("web-abc12", "web-def34")
+        ])
+
+        assert solution_engine.llm_provider.generate_solution.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_coalesce(self, solution_engine):
+        """Test concurrent identical failures make a single LLM call"""
+        async def slow_llm(**kwargs):
+            await asyncio.sleep(0.01)
+            return LLMResponse(content="AI solution", provider="openai", model="gpt-4.1-mini")
+
+        solution_engine.llm_provider.generate_solution.side_effect = slow_llm
+
+        results = await asyncio.gather(*[
+            solution_engine.get_solution("CrashLoopBackOff", "exit code 1") for _ in range(5)
+        ])
+
+        assert results == ["AI solution"] * 5
+        solution_engine.llm_provider.generate_solution.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_failures_share_one_call(self, solution_engine):
+        """Test concurrent identical requests share a failing call instead of retrying it in turn"""
+        async def failing_llm(**kwargs):
+            await asyncio.sleep(0.01)
+            raise Exception("API timeout")
+
+        solution_engine.llm_provider.generate_solution.side_effect = failing_llm
+
+        results = await asyncio.gather(*[
+            solution_engine.get_solution("CrashLoopBackOff", "exit code 1") for _ in range(5)
+        ])
+
+        assert all("temporarily unavailable" in result for result in results)
+        solution_engine.llm_provider.generate_solution.assert_called_once()
+        assert solution_engine._pending_solutions == {}
+
+    @pytest.mark.asyncio
+    async def test_last_state_passed_to_llm(self, solution_engine):
+        """Test a container's last_state is forwarded to the LLM provider"""
+        status = ContainerStatus(
+            name="app", ready=False, restart_count=3, image="app:latest",
+            state="waiting", last_state="terminated: OOMKilled"
+        )
+
+        await solution_engine.get_solution("CrashLoopBackOff", container_statuses=[status])
+
+        sent = solution_engine.llm_provider.generate_solution.call_args.kwargs["container_statuses"]
+        assert sent == [{"name": "app", "restart_count": 3, "last_state": "terminated: OOMKilled"}]
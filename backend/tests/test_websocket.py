@@ -0,0 +1,155 @@
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, Mock, patch
+from services.websocket import WebSocketManager
+from models.models import PodEvent
+
+
+async def flush(manager):
+    """Wait until every client's writer has drained its send queue"""
+    await asyncio.gather(*(queue.join() for queue in list(manager._send_queues.values())))
+
+
+async def never_completes(_):
+    """send_text side effect for a client that never acknowledges"""
+    await asyncio.Event().wait()
+
+
+class TestWebSocketManager:
+
+    @pytest_asyncio.fixture
+    async def manager(self):
+        """Create WebSocketManager instance and stop its writer tasks afterwards"""
+        manager = WebSocketManager()
+        yield manager
+        for connection in list(manager.active_connections):
+            manager.disconnect(connection)
+
+    @pytest.fixture
+    def mock_websocket(self):
+        """Create mock WebSocket connection"""
+        ws = AsyncMock()
+        ws.accept = AsyncMock()
+        ws.send_text = AsyncMock()
+        return ws
+
+    @pytest.mark.asyncio
+    async def test_connect_and_disconnect(self, manager, mock_websocket):
+        """Test connection registration and removal"""
+        await manager.connect(mock_websocket)
+        assert mock_websocket in manager.active_connections
+
+        manager.disconnect(mock_websocket)
+        assert mock_websocket not in manager.active_connections
+
+    @pytest.mark.asyncio
+    async def test_disconnect_after_broadcast_cleanup(self, manager, mock_websocket):
+        """Test disconnect is safe for a connection already dropped by a failed broadcast"""
+        mock_websocket.send_text.side_effect = RuntimeError("closed")
+        await manager.connect(mock_websocket)
+
+        await manager.broadcast_pod_deleted("default", "test-pod")
+        await flush(manager)
+        assert mock_websocket not in manager.active_connections
+
+        manager.disconnect(mock_websocket)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_failed_connections(self, manager, mock_websocket):
+        """Test healthy clients keep receiving after another client fails"""
+        broken = AsyncMock()
+        broken.send_text.side_effect = RuntimeError("closed")
+        await manager.connect(mock_websocket)
+        await manager.connect(broken)
+
+        await manager.broadcast_pod_record_deleted(1)
+        await flush(manager)
+
+        mock_websocket.send_text.assert_called_once()
+        assert manager.active_connections == {mock_websocket}
+        await asyncio.gather(*manager._closing)
+        broken.close.assert_awaited_once_with(code=1013)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_does_not_wait_for_slow_client(self, manager, mock_websocket):
+        """Test a client stuck mid-send does not hold up the broadcaster or other clients"""
+        stuck = AsyncMock()
+        stuck.send_text.side_effect = never_completes
+        await manager.connect(stuck)
+        await manager.connect(mock_websocket)
+
+        await asyncio.wait_for(manager.broadcast_security_rescan_request(), timeout=1.0)
+        await asyncio.wait_for(manager._send_queues[mock_websocket].join(), timeout=1.0)
+
+        mock_websocket.send_text.assert_called_once()
+        assert manager.active_connections == {stuck, mock_websocket}
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_client_with_full_queue(self, manager, mock_websocket):
+        """Test a client that falls too far behind is dropped"""
+        stuck = AsyncMock()
+        stuck.send_text.side_effect = never_completes
+        with patch('services.websocket.SEND_QUEUE_MAXSIZE', 1):
+            await manager.connect(stuck)
+        await manager.connect(mock_websocket)
+
+        for pod_id in range(3):
+            await manager.broadcast_pod_record_deleted(pod_id)
+            await asyncio.sleep(0)
+        await flush(manager)
+
+        assert manager.active_connections == {mock_websocket}
+        assert mock_websocket.send_text.call_count == 3
+        await asyncio.gather(*manager._closing)
+        stuck.close.assert_awaited_once_with(code=1013)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self, manager):
+        """Test every client is sent the same pre-serialized payload object"""
+        clients = [AsyncMock(), AsyncMock(), AsyncMock()]
+        for client in clients:
+            await manager.connect(client)
+
+        await manager.broadcast_pod_deleted("default", "test-pod")
+        await flush(manager)
+
+        payloads = [client.send_text.call_args.args[0] for client in clients]
+        assert all(payload is payloads[0] for payload in payloads)
+        assert '"pod_deleted"' in payloads[0]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_pydantic_model(self, manager, mock_websocket):
+        """Test Pydantic payloads are dumped to JSON-ready data"""
+        await manager.connect(mock_websocket)
+        event = PodEvent(
+            type="Warning",
+            reason="BackOff",
+            message="Back-off restarting failed container",
+            timestamp="2025-01-01T00:00:00Z"
+        )
+
+        await manager._broadcast("pod_event", event)
+        await flush(manager)
+
+        payload = mock_websocket.send_text.call_args.args[0]
+        assert json.loads(payload) == {"type": "pod_event", "data": event.model_dump(mode="json")}
+
+    @pytest.mark.asyncio
+    async def test_payload_broadcasts_use_message_type(self, manager, mock_websocket):
+        """Test pass-through broadcasts send their own message type"""
+        await manager.connect(mock_websocket)
+
+        await manager.broadcast_security_finding_deleted({"id": 7})
+        await flush(manager)
+
+        payload = json.loads(mock_websocket.send_text.call_args.args[0])
+        assert payload == {"type": "security_finding_deleted", "data": {"id": 7}}
+
+    def test_broadcast_methods_are_coroutines_on_specced_mocks(self):
+        """Test Mock(spec=WebSocketManager) exposes broadcasts as awaitable AsyncMocks"""
+        mock_manager = Mock(spec=WebSocketManager)
+
+        assert isinstance(mock_manager.broadcast_pod_failure, AsyncMock)
+        assert isinstance(mock_manager.broadcast_security_finding_deleted, AsyncMock)
@@ -1,7 +1,14 @@
 import asyncio
 import logging
+import sys
 from services.security_scanner import SecurityScanner
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 async def run_scanner():
     """Run the security scanner"""
@@ -14,14 +21,26 @@ def main():
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
+    # The format uses none of these record fields, so skip collecting them
+    # (per the logging HOWTO's optimization notes)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     logger = logging.getLogger(__name__)
     logger.info("Starting Kure Security Scanner...")
 
+    # libuv-backed loop where available; stdlib loop otherwise (e.g. Windows)
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
     try:
-        asyncio.run(run_scanner())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_scanner())
     except KeyboardInterrupt:
         logger.info("Shutting down security scanner...")
+    except Exception:
+        # Task failures were already logged one by one by start_scanning
+        logger.error("Security scanner stopped after a task failure")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,163 @@
 import aiohttp
 import asyncio
+import gzip
 import logging
+import orjson
 import os
-from typing import Dict, Any
+import random
+import socket
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for transient backend failures: exponential backoff with full
+# jitter, stretched to any numeric Retry-After the backend sends. Auth and
+# validation errors (other 4xx) are never retried.
+RETRY_MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 0.1  # seconds
+RETRY_MAX_DELAY = 8.0  # seconds
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+# A timeout or dropped connection may come after the backend applied the
+# request, so by default only these methods are resent after one. Status
+# retries and failures to connect (nothing was sent) apply to every call.
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+# Per-call budgets (across retries); finding ingest gets longer than the rest
+TIMEOUT_DEFAULT = aiohttp.ClientTimeout(total=10)
+TIMEOUT_INGEST = aiohttp.ClientTimeout(total=30)
+
+# Each attempt gets this share of the call's budget (but never less than the
+# floor), so a hung attempt leaves time to retry before the deadline
+ATTEMPT_TIMEOUT_FRACTION = 1 / 3
+ATTEMPT_TIMEOUT_MIN = 1.0  # seconds
+
+# Error responses are only read this far, enough to log the backend's message
+ERROR_BODY_MAX_BYTES = 4096
+
+# Single-finding reports allowed in flight at once
+FINDING_REPORT_CONCURRENCY = 16
+
+# Request bodies larger than this are gzip-compressed (manifests compress well)
+COMPRESS_MIN_BYTES = 1024
+
+# Resource deletes queued within this window are sent as one batch request
+DELETE_COALESCE_WINDOW = 0.1  # seconds
+DELETE_BATCH_MAX = 500  # backend's per-request limit
+
+# Circuit breaker: open after this many consecutive failed calls, then probe
+# again once the reset window has passed
+BREAKER_FAIL_THRESHOLD = 5
+BREAKER_RESET_AFTER = 30.0  # seconds
+
+
+# Absolute monotonic deadline shared by every backend call in the current context
+_deadline: ContextVar[Optional[float]] = ContextVar("backend_deadline", default=None)
+
+
+@contextmanager
+def backend_deadline(seconds: float):
+    """Bound all BackendClient calls made in this block (and in tasks it
+    spawns) by one end-to-end deadline. Nested blocks can only tighten it."""
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def _call_deadline(timeout: Optional[aiohttp.ClientTimeout]) -> Optional[float]:
+    """A call's total timeout is its budget across all retries, capped by any
+    deadline set with backend_deadline()."""
+    deadline = _deadline.get()
+    if timeout is not None and timeout.total:
+        own = time.monotonic() + timeout.total
+        deadline = own if deadline is None else min(deadline, own)
+    return deadline
+
+
+def _error_detail(body: bytes) -> str:
+    """Pull the message out of a backend error body for logging"""
+    try:
+        data = orjson.loads(body)
+        return str(data.get('message', data.get('detail', 'Unknown error')))
+    except Exception:
+        return body[:500].decode('utf-8', 'replace') or "(no response body)"
+
+
+def _retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+    """Seconds the backend asked us to wait (Retry-After), if given as a number"""
+    try:
+        return max(0.0, float(response.headers['Retry-After']))
+    except (KeyError, ValueError):
+        return None
+
+
+def _can_retry(attempt: int, delay: float, deadline: Optional[float]) -> bool:
+    if attempt >= RETRY_MAX_ATTEMPTS - 1:
+        return False
+    return deadline is None or time.monotonic() + delay < deadline
+
+
+class BackendUnavailableError(aiohttp.ClientError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class _CircuitBreaker:
+    """CLOSED -> OPEN after consecutive failures; after the reset window a
+    single HALF_OPEN probe decides whether to close again or stay open."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, fail_threshold: int, reset_after: float):
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_after:
+            # This caller becomes the probe; everyone else waits for its result
+            self.state = self.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info("Backend reachable again, closing circuit breaker")
+        self.state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self):
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.fail_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Backend unavailable, opening circuit breaker for {self.reset_after:.0f}s")
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def abort_probe(self):
+        """A probe was cancelled before it finished; let the next caller probe."""
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+
 
 class BackendClient:
-    def __init__(self, backend_url: str):
+    def __init__(self, backend_url: str, ipv4_only: bool = False):
+        """``ipv4_only`` resolves the backend over IPv4 only, with no
+        happy-eyeballs race, for IPv4 ClusterIP Services. The default
+        connector resolves dual-stack, so IPv6-only clusters keep working."""
         self.backend_url = backend_url.rstrip('/')
+        self.ipv4_only = ipv4_only
         self._service_token = os.environ.get("SERVICE_TOKEN")
         if not self._service_token:
             logger.error(
@@ -17,6 +165,128 @@ class BackendClient:
                 "Outbound requests to the backend will be rejected with 401 "
                 "if the backend requires authentication."
             )
+        # Built once and shared by every request; never mutated
+        self._plain_headers = self._headers()
+        self._json_headers = self._headers('application/json')
+        # Shared across calls so findings reuse warm keep-alive connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Bounds concurrent single-finding reports so a burst can't swamp the backend
+        self._bulkhead = asyncio.Semaphore(FINDING_REPORT_CONCURRENCY)
+        # Shared by every call so an outage short-circuits all of them
+        self._breaker = _CircuitBreaker(BREAKER_FAIL_THRESHOLD, BREAKER_RESET_AFTER)
+        # Resource deletes waiting for the coalescing window, those being sent,
+        # and the batch send in flight
+        self._delete_buf: Set[Tuple[str, str, str]] = set()
+        self._delete_sending: Set[Tuple[str, str, str]] = set()
+        self._delete_timer: Optional[asyncio.TimerHandle] = None
+        self._delete_task: Optional[asyncio.Task] = None
+        # Fire-and-forget reports still running; close() waits for them
+        self._bg_tasks: Set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector_options = {}
+            if self.ipv4_only:
+                connector_options = {'family': socket.AF_INET, 'happy_eyeballs_delay': None}
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=32, keepalive_timeout=75, ttl_dns_cache=300,
+                    **connector_options
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def close(self):
+        """Finish background reports and queued deletes, then close the shared HTTP session"""
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+        await self.flush_deletes()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request_with_retry(self, method: str, url: str, *,
+                                  retry_on_timeout: Optional[bool] = None,
+                                  **kwargs) -> aiohttp.ClientResponse:
+        """Send a request, retrying connection errors, timeouts and retryable statuses.
+
+        Returns the final response (use it as an async context manager to
+        release it). The last connection error or timeout is re-raised once
+        attempts run out. Timeouts and dropped connections are only retried
+        when ``retry_on_timeout`` is set (default: the method is in
+        IDEMPOTENT_METHODS). A ``json`` body is encoded once with orjson (and
+        gzipped when large) and reused across attempts.
+
+        Raises BackendUnavailableError without touching the network while
+        the circuit breaker is open.
+        """
+        if not self._breaker.allow_request():
+            raise BackendUnavailableError(f"Backend circuit open, skipping {method} {url}")
+
+        if 'json' in kwargs:
+            data = orjson.dumps(kwargs.pop('json'))
+            if len(data) > COMPRESS_MIN_BYTES:
+                data = gzip.compress(data, compresslevel=6)
+                kwargs['headers'] = {**kwargs.get('headers', {}), 'Content-Encoding': 'gzip'}
+            kwargs['data'] = data
+
+        try:
+            if retry_on_timeout is None:
+                retry_on_timeout = method in IDEMPOTENT_METHODS
+            response = await self._send_with_retry(method, url, kwargs, retry_on_timeout)
+        except (asyncio.TimeoutError, aiohttp.ClientError):
+            self._breaker.record_failure()
+            raise
+        except BaseException:
+            self._breaker.abort_probe()
+            raise
+
+        if response.status >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return response
+
+    async def _send_with_retry(self, method: str, url: str, kwargs: dict,
+                               retry_on_timeout: bool) -> aiohttp.ClientResponse:
+        session = await self._get_session()
+        deadline = _call_deadline(kwargs.pop('timeout', None))
+        if deadline is not None:
+            attempt_timeout = max(ATTEMPT_TIMEOUT_MIN,
+                                  (deadline - time.monotonic()) * ATTEMPT_TIMEOUT_FRACTION)
+        for attempt in range(RETRY_MAX_ATTEMPTS):
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"Deadline exceeded before {method} {url}")
+                kwargs['timeout'] = aiohttp.ClientTimeout(total=min(remaining, attempt_timeout))
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+            try:
+                response = await session.request(method, url, **kwargs)
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                never_sent = isinstance(e, aiohttp.ClientConnectorError)
+                if not (retry_on_timeout or never_sent) or not _can_retry(attempt, delay, deadline):
+                    raise
+                logger.debug("%s %s failed (%r), retrying", method, url, e)
+            else:
+                if response.status not in RETRY_STATUSES:
+                    return response
+                retry_after = _retry_after(response)
+                if retry_after is not None:
+                    delay = min(RETRY_MAX_DELAY, max(delay, retry_after))
+                if not _can_retry(attempt, delay, deadline):
+                    return response
+                response.release()
+                logger.debug("%s %s returned HTTP %d, retrying", method, url, response.status)
+            await asyncio.sleep(delay)
 
     def _headers(self, content_type: str = None) -> dict:
         """Build request headers, including the service token for ingest auth."""
@@ -27,134 +297,292 @@ class BackendClient:
             headers['X-Service-Token'] = self._service_token
         return headers
 
+    async def _request(self, method: str, path: str, *, json_body: Any = None,
+                       timeout: aiohttp.ClientTimeout = TIMEOUT_DEFAULT,
+                       read_body: bool = True,
+                       retry_on_timeout: Optional[bool] = None) -> Tuple[int, bytes]:
+        """Send a request to a backend path and return (status, body).
+
+        With ``read_body=False`` a 200's body is read and dropped (body is
+        b""); acknowledgements are small, and reading to the end is what
+        lets the connection go back to the pool. Error bodies are read only
+        up to ERROR_BODY_MAX_BYTES, enough to log. Connection errors and
+        timeouts that survive the retries propagate.
+        """
+        kwargs = {'timeout': timeout}
+        if json_body is not None:
+            kwargs['json'] = json_body
+            kwargs['headers'] = self._json_headers
+        else:
+            kwargs['headers'] = self._plain_headers
+        async with await self._request_with_retry(
+            method, f"{self.backend_url}{path}", retry_on_timeout=retry_on_timeout, **kwargs
+        ) as response:
+            if response.status != 200:
+                return response.status, await response.content.read(ERROR_BODY_MAX_BYTES)
+            body = await response.read()
+            return response.status, body if read_body else b""
+
+    async def _send(self, method: str, path: str, action: str, *, json_body: Any = None,
+                    timeout: aiohttp.ClientTimeout = TIMEOUT_DEFAULT,
+                    level: int = logging.WARNING, read_body: bool = False,
+                    retry_on_timeout: Optional[bool] = None) -> Optional[bytes]:
+        """Send a request whose failure is logged rather than raised.
+
+        Returns the response body on HTTP 200 (b"" unless ``read_body``)
+        and None on any failure. ``action`` completes the log line, e.g.
+        "clearing findings".
+        """
+        try:
+            status, body = await self._request(
+                method, path, json_body=json_body, timeout=timeout, read_body=read_body,
+                retry_on_timeout=retry_on_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.log(level, f"Timeout while {action} ({timeout.total:.0f}s)")
+            return None
+        except aiohttp.ClientError as e:
+            logger.log(level, f"HTTP client error while {action}: {e}")
+            return None
+        except Exception as e:
+            logger.log(level, f"Unexpected error while {action}: {e}")
+            return None
+
+        if status != 200:
+            logger.log(level, f"Backend returned HTTP {status} while {action}: {_error_detail(body)}")
+            return None
+        return body
+
+    async def _fetch(self, path: str, what: str) -> Any:
+        """GET and decode a JSON document, raising Exception on any failure"""
+        try:
+            status, body = await self._request('GET', path)
+        except asyncio.TimeoutError:
+            raise Exception(f"Timeout while fetching {what} ({TIMEOUT_DEFAULT.total:.0f}s)")
+        except aiohttp.ClientError as e:
+            raise Exception(f"HTTP client error: {e}")
+        except Exception as e:
+            raise Exception(f"Error fetching {what}: {e}")
+
+        if status != 200:
+            raise Exception(f"Backend returned HTTP {status}")
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise Exception(f"Error fetching {what}: {e}")
+
     async def report_security_finding(self, finding_data: Dict[str, Any]):
         """Send security finding to backend"""
         finding_identifier = f"{finding_data.get('resource_type', 'unknown')}/{finding_data.get('namespace', 'unknown')}/{finding_data.get('resource_name', 'unknown')}"
+        logger.info("Sending security finding for %s to backend", finding_identifier)
 
-        try:
-            logger.info(f"Sending security finding for {finding_identifier} to backend")
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                        f"{self.backend_url}/api/security/findings",
-                        json=finding_data,
-                        headers=self._headers('application/json'),
-                        timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Successfully reported security finding for {finding_identifier}")
-                        return True
-                    else:
-                        try:
-                            error_data = await response.json()
-                            error_msg = error_data.get('message', error_data.get('detail', 'Unknown error'))
-                            logger.error(f"Backend returned HTTP {response.status} for {finding_identifier}: {error_msg}")
-                        except Exception:
-                            try:
-                                error_text = await response.text()
-                                logger.error(f"Backend returned HTTP {response.status} for {finding_identifier}: {error_text}")
-                            except Exception:
-                                logger.error(f"Backend returned HTTP {response.status} for {finding_identifier} (no response body)")
-
-                        return False
+        # A rescan deletes the resource's old findings first; they must land before this one
+        await self._flush_deletes_for([finding_data])
+        async with self._bulkhead:
+            body = await self._send(
+                'POST', '/api/security/findings', f"reporting security finding for {finding_identifier}",
+                json_body=finding_data, timeout=TIMEOUT_INGEST, level=logging.ERROR,
+                # Upserted on (resource, title), so a resend after a timeout is harmless
+                retry_on_timeout=True
+            )
+        if body is None:
+            return False
+        logger.info("Successfully reported security finding for %s", finding_identifier)
+        return True
+
+    async def report_security_findings_batch(self, findings: List[Dict[str, Any]]):
+        """Send several security findings to backend in one request.
+
+        Findings the backend rejects are logged by index; the rest of the
+        batch is still saved. Falls back to one request per finding when
+        the backend predates the batch endpoint.
+        """
+        if not findings:
+            return True
 
+        await self._flush_deletes_for(findings)
+        action = f"reporting batch of {len(findings)} security findings"
+        logger.info("Sending batch of %d security findings to backend", len(findings))
+        try:
+            status, body = await self._request(
+                'POST', '/api/security/findings/batch', json_body={"findings": findings}, timeout=TIMEOUT_INGEST
+            )
         except asyncio.TimeoutError:
-            logger.error(f"Timeout while reporting security finding for {finding_identifier} (30s)")
-            return False
-        except aiohttp.ClientError as e:
-            logger.error(f"HTTP client error while reporting security finding for {finding_identifier}: {e}")
+            logger.error(f"Timeout while {action} ({TIMEOUT_INGEST.total:.0f}s)")
             return False
         except Exception as e:
-            logger.error(f"Unexpected error while reporting security finding for {finding_identifier}: {e}")
+            logger.error(f"Error while {action}: {e}")
             return False
 
+        if status == 404:
+            logger.warning("Backend has no batch findings endpoint, reporting findings one by one")
+            return await self.report_many(findings)
+        if status != 200:
+            logger.error(f"Backend returned HTTP {status} while {action}: {_error_detail(body)}")
+            return False
+
+        result = orjson.loads(body)
+        for error in result.get('errors', []):
+            finding = findings[error['index']]
+            logger.error(
+                f"Backend rejected security finding "
+                f"{finding.get('resource_type', 'unknown')}/{finding.get('namespace', 'unknown')}/"
+                f"{finding.get('resource_name', 'unknown')}: {error.get('detail')}"
+            )
+        logger.info("Successfully reported %d of %d security findings", result.get('saved', 0), len(findings))
+        return not result.get('errors')
+
+    async def report_many(self, findings: List[Dict[str, Any]]):
+        """Send findings one per request, up to FINDING_REPORT_CONCURRENCY at a time"""
+        results = await asyncio.gather(*(self.report_security_finding(finding) for finding in findings))
+        return all(results)
+
     async def clear_security_findings(self):
         """Clear all security findings before starting a new scan"""
+        logger.info("Clearing previous security findings from backend")
+        if await self._send('POST', '/api/security/scan/clear', "clearing previous security findings",
+                            retry_on_timeout=True) is None:
+            return False
+        logger.info("Successfully cleared previous security findings")
+        return True
+
+    async def delete_findings_by_resource(self, resource_type: str, namespace: str, resource_name: str) -> None:
+        """Queue deletion of all findings for a resource (when it is deleted or rescanned).
+
+        Fire-and-forget: deletes queued within DELETE_COALESCE_WINDOW of each
+        other go to the backend as one batch request, with duplicates merged,
+        and failures are logged rather than returned. A report for a resource
+        with a delete still queued or in flight waits for it first so it
+        can't be overtaken; call flush_deletes() to wait for the queue
+        explicitly.
+        """
+        logger.info("Deleting findings for deleted resource: %s/%s/%s", resource_type, namespace, resource_name)
+        self._delete_buf.add((resource_type, namespace, resource_name))
+        if self._delete_timer is None:
+            self._delete_timer = asyncio.get_running_loop().call_later(
+                DELETE_COALESCE_WINDOW, self._start_delete_flush
+            )
+
+    def _start_delete_flush(self):
+        """Hand the queued deletes to a background batch send, after any still in flight"""
+        if self._delete_timer is not None:
+            self._delete_timer.cancel()
+            self._delete_timer = None
+        if not self._delete_buf:
+            return
+        items, self._delete_buf = list(self._delete_buf), set()
+        self._delete_sending.update(items)
+        self._delete_task = asyncio.get_running_loop().create_task(
+            self._send_deletes(self._delete_task, items)
+        )
+
+    async def _send_deletes(self, previous: Optional[asyncio.Task], items: List[Tuple[str, str, str]]):
         try:
-            logger.info("Clearing previous security findings from backend")
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                        f"{self.backend_url}/api/security/scan/clear",
-                        headers=self._headers('application/json'),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        logger.info("Successfully cleared previous security findings")
-                        return True
-                    else:
-                        logger.warning(f"Backend returned HTTP {response.status} when clearing findings")
-                        return False
+            if previous is not None:
+                await asyncio.wait([previous])
+            for start in range(0, len(items), DELETE_BATCH_MAX):
+                await self.delete_findings_batch(items[start:start + DELETE_BATCH_MAX])
+        finally:
+            self._delete_sending.difference_update(items)
+
+    async def flush_deletes(self):
+        """Send queued deletes now and wait until all of them have been sent"""
+        self._start_delete_flush()
+        if self._delete_task is not None:
+            await asyncio.shield(self._delete_task)
+
+    async def _flush_deletes_for(self, findings: List[Dict[str, Any]]):
+        """Wait for queued deletes only if one targets a resource being reported"""
+        if not self._delete_buf and not self._delete_sending:
+            return
+        for finding in findings:
+            key = (finding.get('resource_type'), finding.get('namespace'), finding.get('resource_name'))
+            if key in self._delete_buf or key in self._delete_sending:
+                await self.flush_deletes()
+                return
+
+    async def delete_findings_batch(self, items: List[Tuple[str, str, str]]) -> bool:
+        """Delete all findings for several (resource_type, namespace, resource_name)
+        resources in one request. Falls back to one request per resource when
+        the backend predates the batch endpoint."""
+        if not items:
+            return True
 
+        action = f"deleting findings for {len(items)} resources"
+        try:
+            status, body = await self._request(
+                'POST', '/api/security/findings/resource/batch',
+                json_body={"items": [
+                    {"resource_type": resource_type, "namespace": namespace, "resource_name": resource_name}
+                    for resource_type, namespace, resource_name in items
+                ]}
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout while {action} ({TIMEOUT_DEFAULT.total:.0f}s)")
+            return False
         except Exception as e:
-            logger.warning(f"Could not clear previous security findings: {e}")
+            logger.warning(f"Error while {action}: {e}")
             return False
 
-    async def delete_findings_by_resource(self, resource_type: str, namespace: str, resource_name: str) -> bool:
-        """Delete all findings for a specific resource (when resource is deleted from cluster)"""
-        resource_identifier = f"{resource_type}/{namespace}/{resource_name}"
+        if status == 404:
+            logger.warning("Backend has no batch delete endpoint, deleting findings one resource at a time")
+            results = await asyncio.gather(*(self._delete_resource(*item) for item in items))
+            return all(results)
+        if status != 200:
+            logger.warning(f"Backend returned HTTP {status} while {action}: {_error_detail(body)}")
+            return False
 
-        try:
-            logger.info(f"Deleting findings for deleted resource: {resource_identifier}")
-
-            async with aiohttp.ClientSession() as session:
-                async with session.delete(
-                        f"{self.backend_url}/api/security/findings/resource/{resource_type}/{namespace}/{resource_name}",
-                        headers=self._headers(),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        count = data.get('count', 0)
-                        logger.info(f"Successfully deleted {count} findings for {resource_identifier}")
-                        return True
-                    else:
-                        logger.warning(f"Backend returned HTTP {response.status} when deleting findings for {resource_identifier}")
-                        return False
+        count = orjson.loads(body).get('count', 0)
+        logger.info("Successfully deleted %d findings for %d resources", count, len(items))
+        return True
 
-        except Exception as e:
-            logger.warning(f"Could not delete findings for {resource_identifier}: {e}")
+    async def _delete_resource(self, resource_type: str, namespace: str, resource_name: str) -> bool:
+        """Delete one resource's findings with the per-resource endpoint"""
+        resource_identifier = f"{resource_type}/{namespace}/{resource_name}"
+        body = await self._send(
+            'DELETE', f"/api/security/findings/resource/{resource_type}/{namespace}/{resource_name}",
+            f"deleting findings for {resource_identifier}", read_body=True
+        )
+        if body is None:
             return False
+        count = orjson.loads(body).get('count', 0)
+        logger.info("Successfully deleted %d findings for %s", count, resource_identifier)
+        return True
 
-    async def report_scan_duration(self, duration_seconds: float):
-        """Report security scan duration to backend for Prometheus metrics"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.backend_url}/api/metrics/security-scan-duration",
-                    json={"duration_seconds": duration_seconds},
-                    headers=self._headers('application/json'),
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Reported scan duration: {duration_seconds:.1f}s")
-                        return True
-                    else:
-                        logger.warning(f"Failed to report scan duration: HTTP {response.status}")
-                        return False
-        except Exception as e:
-            logger.warning(f"Error reporting scan duration: {e}")
+    def _in_background(self, coro) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    async def report_scan_duration(self, duration_seconds: float, wait: bool = True):
+        """Report security scan duration to backend for Prometheus metrics.
+
+        With ``wait=False`` the report is sent in the background and None is
+        returned straight away; failures are only logged either way.
+        """
+        if not wait:
+            self._in_background(self.report_scan_duration(duration_seconds))
+            return None
+        body = await self._send(
+            'POST', '/api/metrics/security-scan-duration', "reporting scan duration",
+            json_body={"duration_seconds": duration_seconds}
+        )
+        if body is None:
             return False
+        logger.info(f"Reported scan duration: {duration_seconds:.1f}s")
+        return True
 
     async def report_rescan_status(self, status: str, reason: str = None):
         """Report security rescan status to backend (started/completed)"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.backend_url}/api/security/rescan-status",
-                    json={"status": status, "reason": reason},
-                    headers=self._headers('application/json'),
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Reported rescan status: {status}")
-                        return True
-                    else:
-                        logger.warning(f"Failed to report rescan status: HTTP {response.status}")
-                        return False
-        except Exception as e:
-            logger.warning(f"Error reporting rescan status: {e}")
+        body = await self._send(
+            'POST', '/api/security/rescan-status', f"reporting rescan status '{status}'",
+            json_body={"status": status, "reason": reason}
+        )
+        if body is None:
             return False
+        logger.info(f"Reported rescan status: {status}")
+        return True
 
     async def get_excluded_namespaces(self) -> list:
         """Get list of excluded namespaces from backend
@@ -165,30 +593,10 @@ class BackendClient:
         Raises:
             Exception: If unable to fetch from backend
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                        f"{self.backend_url}/api/admin/excluded-namespaces",
-                        headers=self._headers(),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        namespaces = [item.get('namespace') for item in data if item.get('namespace')]
-                        logger.debug(f"Fetched excluded namespaces: {namespaces}")
-                        return namespaces
-                    else:
-                        raise Exception(f"Backend returned HTTP {response.status}")
-
-        except asyncio.TimeoutError:
-            raise Exception("Timeout while fetching excluded namespaces (10s)")
-        except aiohttp.ClientError as e:
-            raise Exception(f"HTTP client error: {e}")
-        except Exception as e:
-            # Re-raise if it's already our exception
-            if "Backend returned" in str(e) or "Timeout" in str(e) or "HTTP client" in str(e):
-                raise
-            raise Exception(f"Error fetching excluded namespaces: {e}")
+        data = await self._fetch('/api/admin/excluded-namespaces', "excluded namespaces")
+        namespaces = [namespace for item in data if (namespace := item.get('namespace'))]
+        logger.debug("Fetched excluded namespaces: %s", namespaces)
+        return namespaces
 
     async def get_excluded_rules(self) -> list:
         """Get list of excluded rules from backend
@@ -199,35 +607,16 @@ class BackendClient:
         Raises:
             Exception: If unable to fetch from backend
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                        f"{self.backend_url}/api/admin/excluded-rules",
-                        headers=self._headers(),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        rules = [
-                            {
-                                'rule_title': item.get('rule_title'),
-                                'namespace': item.get('namespace')
-                            }
-                            for item in data if item.get('rule_title')
-                        ]
-                        logger.debug(f"Fetched excluded rules: {rules}")
-                        return rules
-                    else:
-                        raise Exception(f"Backend returned HTTP {response.status}")
-
-        except asyncio.TimeoutError:
-            raise Exception("Timeout while fetching excluded rules (10s)")
-        except aiohttp.ClientError as e:
-            raise Exception(f"HTTP client error: {e}")
-        except Exception as e:
-            if "Backend returned" in str(e) or "Timeout" in str(e) or "HTTP client" in str(e):
-                raise
-            raise Exception(f"Error fetching excluded rules: {e}")
+        data = await self._fetch('/api/admin/excluded-rules', "excluded rules")
+        rules = [
+            {
+                'rule_title': rule_title,
+                'namespace': item.get('namespace')
+            }
+            for item in data if (rule_title := item.get('rule_title'))
+        ]
+        logger.debug("Fetched excluded rules: %s", rules)
+        return rules
 
     async def get_trusted_registries(self) -> list:
         """Get list of admin-added trusted container registries from backend
@@ -238,29 +627,7 @@ class BackendClient:
         Raises:
             Exception: If unable to fetch from backend
         """
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                        f"{self.backend_url}/api/admin/trusted-registries",
-                        headers=self._headers(),
-                        timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        registries = [
-                            item.get('registry')
-                            for item in data if item.get('registry')
-                        ]
-                        logger.debug(f"Fetched trusted registries: {registries}")
-                        return registries
-                    else:
-                        raise Exception(f"Backend returned HTTP {response.status}")
-
-        except asyncio.TimeoutError:
-            raise Exception("Timeout while fetching trusted registries (10s)")
-        except aiohttp.ClientError as e:
-            raise Exception(f"HTTP client error: {e}")
-        except Exception as e:
-            if "Backend returned" in str(e) or "Timeout" in str(e) or "HTTP client" in str(e):
-                raise
-            raise Exception(f"Error fetching trusted registries: {e}")
+        data = await self._fetch('/api/admin/trusted-registries', "trusted registries")
+        registries = [registry for item in data if (registry := item.get('registry'))]
+        logger.debug("Fetched trusted registries: %s", registries)
+        return registries
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Set, TYPE_CHECKING
+from typing import FrozenSet, List, Optional, Dict, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from services.security_scanner import SecurityScanner
@@ -15,8 +15,8 @@ class ExclusionManager:
 
     def __init__(self, scanner: 'SecurityScanner'):
         self.scanner = scanner
-        # Cache for admin-configured excluded namespaces
-        self.excluded_namespaces: List[str] = []
+        # Cache for admin-configured excluded namespaces (a set: checked for every resource)
+        self.excluded_namespaces: FrozenSet[str] = frozenset()
         self.excluded_namespaces_last_refresh: Optional[datetime] = None
         self.excluded_namespaces_refresh_interval = timedelta(minutes=1)
         # Cache for admin-configured excluded rules
@@ -36,10 +36,10 @@ class ExclusionManager:
                 now - self.excluded_namespaces_last_refresh > self.excluded_namespaces_refresh_interval):
             try:
                 namespaces = await self.scanner.backend_client.get_excluded_namespaces()
-                self.excluded_namespaces = namespaces
+                self.excluded_namespaces = frozenset(namespaces)
                 self.excluded_namespaces_last_refresh = now
                 if self.excluded_namespaces:
-                    logger.info(f"Refreshed excluded namespaces: {self.excluded_namespaces}")
+                    logger.info(f"Refreshed excluded namespaces: {sorted(self.excluded_namespaces)}")
                 else:
                     logger.info("No excluded namespaces configured")
                 return True
@@ -1,5 +1,6 @@
 import logging
 import yaml
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -65,8 +66,9 @@ def get_resource_manifest(resource_obj, api_version: str, kind: str) -> str:
         return ""
 
 
+@lru_cache(maxsize=4096)
 def get_image_registry(image: str) -> Optional[str]:
-    """Extract registry from container image string"""
+    """Extract registry from container image string (cached: the same images recur across pods)"""
     if not image:
         return None
     parts = image.split('/')
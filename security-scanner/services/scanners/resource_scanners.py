@@ -1,5 +1,7 @@
+import asyncio
 import re
 import logging
+from collections import defaultdict
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -10,6 +12,71 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# ConfigMap values that look like credentials, in priority order: when a
+# value matches several, the first one listed names the finding. Matched
+# against the lowercased value, which is cheaper than re.IGNORECASE.
+SENSITIVE_VALUE_PATTERNS = [
+    ('password', r'password\s*[=:]\s*\S+'),
+    ('api_key', r'api[_-]?key\s*[=:]\s*\S+'),
+    ('secret_key', r'secret[_-]?key\s*[=:]\s*\S+'),
+    ('access_token', r'access[_-]?token\s*[=:]\s*\S+'),
+    ('private_key', r'private[_-]?key|-----begin\s+(?:rsa\s+)?private\s+key-----'),
+    ('aws_secret', r'aws[_-]?secret[_-]?access[_-]?key'),
+]
+# One alternation so a value without credentials is scanned once; the named
+# group that matched says which pattern hit first (leftmost in the value)
+SENSITIVE_VALUE_RE = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in SENSITIVE_VALUE_PATTERNS))
+SENSITIVE_VALUE_CHECKS = [(name, re.compile(pattern)) for name, pattern in SENSITIVE_VALUE_PATTERNS]
+# The literal every SENSITIVE_VALUE_RE branch starts with. Values containing
+# none of them can't match, and substring checks are far cheaper than the regex.
+SENSITIVE_VALUE_HINTS = ('password', 'api', 'secret', 'access', 'private', '-----begin', 'aws')
+SENSITIVE_VALUE_NAMES = {
+    'password': 'password',
+    'api_key': 'API key',
+    'secret_key': 'secret key',
+    'access_token': 'access token',
+    'private_key': 'private key',
+    'aws_secret': 'AWS secret',
+}
+
+# ConfigMap keys whose names suggest they hold credentials
+SENSITIVE_KEYS = [
+    'password', 'passwd', 'secret', 'token', 'api_key', 'apikey',
+    'private_key', 'privatekey', 'credentials', 'auth'
+]
+
+
+def _sensitive_value_kind(value_lower: str, leftmost: str) -> str:
+    """Highest-priority pattern matching anywhere in the value, given the one
+    that matched leftmost; only patterns listed before it need checking"""
+    for name, pattern in SENSITIVE_VALUE_CHECKS:
+        if name == leftmost:
+            return name
+        if pattern.search(value_lower):
+            return name
+    return leftmost
+
+
+def find_sensitive_data(data: dict) -> set:
+    """Describe the keys and values of a ConfigMap's data that look like credentials"""
+    found_sensitive = set()
+
+    for key, value in data.items():
+        key_lower = key.lower()
+        for sensitive_key in SENSITIVE_KEYS:
+            if sensitive_key in key_lower:
+                found_sensitive.add(f"key '{key}' (contains '{sensitive_key}')")
+                break
+
+        value_lower = value.lower() if value else ""
+        if any(hint in value_lower for hint in SENSITIVE_VALUE_HINTS):
+            match = SENSITIVE_VALUE_RE.search(value_lower)
+            if match:
+                kind = _sensitive_value_kind(value_lower, match.lastgroup)
+                found_sensitive.add(f"value matching '{SENSITIVE_VALUE_NAMES[kind]}' pattern")
+
+    return found_sensitive
+
 
 class ResourceScanner:
     """Non-pod security scanners: deployments, services, RBAC, network policies, etc."""
@@ -578,13 +645,10 @@ class ResourceScanner:
             pdbs = self.scanner.policy_v1.list_pod_disruption_budget_for_all_namespaces()
             timestamp = datetime.utcnow().isoformat() + "Z"
 
-            pdb_selectors = {}
+            pdb_selectors = defaultdict(list)
             for pdb in pdbs.items:
-                ns = pdb.metadata.namespace
-                if ns not in pdb_selectors:
-                    pdb_selectors[ns] = []
                 if pdb.spec.selector and pdb.spec.selector.match_labels:
-                    pdb_selectors[ns].append(pdb.spec.selector.match_labels)
+                    pdb_selectors[pdb.metadata.namespace].append(pdb.spec.selector.match_labels)
 
             for deployment in deployments.items:
                 if self.scanner.exclusion_mgr.is_namespace_excluded(deployment.metadata.namespace):
@@ -602,11 +666,10 @@ class ResourceScanner:
                 deploy_labels = deployment.spec.selector.match_labels or {}
                 has_pdb = False
 
-                if namespace in pdb_selectors:
-                    for pdb_labels in pdb_selectors[namespace]:
-                        if all(deploy_labels.get(k) == v for k, v in pdb_labels.items()):
-                            has_pdb = True
-                            break
+                for pdb_labels in pdb_selectors.get(namespace, ()):
+                    if all(deploy_labels.get(k) == v for k, v in pdb_labels.items()):
+                        has_pdb = True
+                        break
 
                 if not has_pdb:
                     await self.scanner.report_finding({
@@ -683,48 +746,25 @@ class ResourceScanner:
         """Scan ConfigMaps for sensitive data patterns"""
         logger.info("Scanning ConfigMaps for sensitive data...")
         try:
-            configmaps = self.scanner.v1.list_config_map_for_all_namespaces()
+            # Listing every ConfigMap and matching its data is blocking work;
+            # run both in the default executor so watches keep being served
+            loop = asyncio.get_running_loop()
+            configmaps = await loop.run_in_executor(None, self.scanner.v1.list_config_map_for_all_namespaces)
             timestamp = datetime.utcnow().isoformat() + "Z"
 
-            sensitive_patterns = [
-                (r'password\s*[=:]\s*\S+', 'password'),
-                (r'api[_-]?key\s*[=:]\s*\S+', 'API key'),
-                (r'secret[_-]?key\s*[=:]\s*\S+', 'secret key'),
-                (r'access[_-]?token\s*[=:]\s*\S+', 'access token'),
-                (r'private[_-]?key', 'private key'),
-                (r'-----BEGIN\s+(RSA\s+)?PRIVATE\s+KEY-----', 'private key'),
-                (r'aws[_-]?secret[_-]?access[_-]?key', 'AWS secret'),
-            ]
-
-            sensitive_keys = [
-                'password', 'passwd', 'secret', 'token', 'api_key', 'apikey',
-                'private_key', 'privatekey', 'credentials', 'auth'
+            candidates = [
+                cm for cm in configmaps.items
+                if not self.scanner.exclusion_mgr.is_namespace_excluded(cm.metadata.namespace)
             ]
+            results = await loop.run_in_executor(
+                None, lambda: [find_sensitive_data(cm.data or {}) for cm in candidates]
+            )
 
-            for cm in configmaps.items:
-                if self.scanner.exclusion_mgr.is_namespace_excluded(cm.metadata.namespace):
-                    continue
-
+            for cm, found_sensitive in zip(candidates, results):
                 cm_name = cm.metadata.name
                 namespace = cm.metadata.namespace
-                data = cm.data or {}
                 self.scanner._clear_resource_context()
 
-                found_sensitive = set()
-
-                for key, value in data.items():
-                    key_lower = key.lower()
-                    for sensitive_key in sensitive_keys:
-                        if sensitive_key in key_lower:
-                            found_sensitive.add(f"key '{key}' (contains '{sensitive_key}')")
-                            break
-
-                    if value:
-                        for pattern, pattern_name in sensitive_patterns:
-                            if re.search(pattern, value, re.IGNORECASE):
-                                found_sensitive.add(f"value matching '{pattern_name}' pattern")
-                                break
-
                 if found_sensitive:
                     await self.scanner.report_finding({
                         "resource_type": "ConfigMap",
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import os
 import time
-from typing import Set, Tuple
+from typing import List, Optional, Set, Tuple
 
 from kubernetes import client, config
 
@@ -15,11 +15,17 @@ from services.scanners import PodScanner, ResourceScanner
 
 logger = logging.getLogger(__name__)
 
+# Findings buffered during a full cluster scan are sent in batches of this size
+FINDING_BATCH_SIZE = 100
+
 
 class SecurityScanner:
     def __init__(self):
         self.backend_url = os.getenv("BACKEND_URL", "http://kure-monitor-backend:8000")
-        self.backend_client = BackendClient(self.backend_url)
+        self.backend_client = BackendClient(
+            self.backend_url,
+            ipv4_only=os.getenv("BACKEND_IPV4_ONLY", "false").lower() == "true"
+        )
         self.websocket_client = WebSocketClient(self.backend_url)
         self.v1 = None
         self.apps_v1 = None
@@ -34,6 +40,8 @@ class SecurityScanner:
         self._current_resource_obj = None
         self._current_resource_api_version = None
         self._current_resource_kind = None
+        # Findings buffered while a full scan runs; None outside a scan
+        self._finding_batch: Optional[List[dict]] = None
         # Composed helpers
         self.exclusion_mgr = ExclusionManager(self)
         self.watch_mgr = WatchManager(self)
@@ -92,7 +100,20 @@ class SecurityScanner:
         if resource_type and namespace and resource_name:
             self.tracked_resources.add((resource_type, namespace, resource_name))
 
-        await self.backend_client.report_security_finding(finding_data)
+        if self._finding_batch is None:
+            await self.backend_client.report_security_finding(finding_data)
+            return
+
+        self._finding_batch.append(finding_data)
+        if len(self._finding_batch) >= FINDING_BATCH_SIZE:
+            await self.flush_findings()
+
+    async def flush_findings(self):
+        """Send any findings buffered by an in-progress full scan"""
+        if not self._finding_batch:
+            return
+        batch, self._finding_batch = self._finding_batch, []
+        await self.backend_client.report_security_findings_batch(batch)
 
     async def _wait_for_backend(self, max_retries: int = 30, retry_interval: float = 2.0):
         """Wait for backend to be ready before starting scan"""
@@ -117,28 +138,39 @@ class SecurityScanner:
         """Run all security checks"""
         start_time = time.monotonic()
 
-        await self.exclusion_mgr.refresh_excluded_namespaces()
-        await self.exclusion_mgr.refresh_excluded_rules()
-
-        await self.pod_scanner.scan_pods()
-        await self.resource_scanner.scan_deployments()
-        await self.resource_scanner.scan_services()
-        await self.resource_scanner.scan_rbac()
-        await self.resource_scanner.scan_network_policies()
-        await self.pod_scanner.scan_service_accounts()
-        await self.resource_scanner.scan_pod_security_admission()
-        await self.resource_scanner.scan_ingresses()
-        await self.pod_scanner.scan_seccomp_profiles()
-        await self.resource_scanner.scan_cluster_role_bindings()
-        await self.resource_scanner.scan_pod_disruption_budgets()
-        await self.resource_scanner.scan_resource_quotas()
-        await self.resource_scanner.scan_configmaps()
-        await self.resource_scanner.scan_cronjobs()
-        await self.resource_scanner.scan_persistent_volumes()
+        # Buffer findings so they go out in batches; a nested scan (e.g. a
+        # rescan triggered mid-scan) shares the outer scan's buffer
+        owns_batch = self._finding_batch is None
+        if owns_batch:
+            self._finding_batch = []
+        try:
+            await self.exclusion_mgr.refresh_excluded_namespaces()
+            await self.exclusion_mgr.refresh_excluded_rules()
+
+            await self.pod_scanner.scan_pods()
+            await self.resource_scanner.scan_deployments()
+            await self.resource_scanner.scan_services()
+            await self.resource_scanner.scan_rbac()
+            await self.resource_scanner.scan_network_policies()
+            await self.pod_scanner.scan_service_accounts()
+            await self.resource_scanner.scan_pod_security_admission()
+            await self.resource_scanner.scan_ingresses()
+            await self.pod_scanner.scan_seccomp_profiles()
+            await self.resource_scanner.scan_cluster_role_bindings()
+            await self.resource_scanner.scan_pod_disruption_budgets()
+            await self.resource_scanner.scan_resource_quotas()
+            await self.resource_scanner.scan_configmaps()
+            await self.resource_scanner.scan_cronjobs()
+            await self.resource_scanner.scan_persistent_volumes()
+        finally:
+            if owns_batch:
+                await self.flush_findings()
+                self._finding_batch = None
 
         duration = time.monotonic() - start_time
         logger.info(f"Security scan completed in {duration:.1f}s")
-        await self.backend_client.report_scan_duration(duration)
+        # Metrics only: don't hold up scan completion on the backend's ack
+        await self.backend_client.report_scan_duration(duration, wait=False)
 
     async def start_scanning(self):
         """Start real-time security scanning with Kubernetes watches"""
@@ -164,38 +196,46 @@ class SecurityScanner:
         logger.info("Initial security scan completed - switching to real-time mode")
 
         rs = self.resource_scanner
-        watch_tasks = [
-            asyncio.create_task(self.watch_mgr.watch_pods()),
-            asyncio.create_task(self.watch_mgr.create_namespaced_watch(
+        watches = [
+            self.watch_mgr.watch_pods(),
+            self.watch_mgr.create_namespaced_watch(
                 "Deployment", self.apps_v1.list_deployment_for_all_namespaces,
-                "deploy-watch", rs.scan_single_deployment)),
-            asyncio.create_task(self.watch_mgr.create_namespaced_watch(
+                "deploy-watch", rs.scan_single_deployment),
+            self.watch_mgr.create_namespaced_watch(
                 "Service", self.v1.list_service_for_all_namespaces,
-                "svc-watch", rs.scan_single_service)),
-            asyncio.create_task(self.watch_mgr.create_cluster_watch(
+                "svc-watch", rs.scan_single_service),
+            self.watch_mgr.create_cluster_watch(
                 "ClusterRole", self.rbac_v1.list_cluster_role,
-                "cr-watch", rs.scan_single_cluster_role, skip_system_prefix=True)),
-            asyncio.create_task(self.watch_mgr.create_namespaced_watch(
+                "cr-watch", rs.scan_single_cluster_role, skip_system_prefix=True),
+            self.watch_mgr.create_namespaced_watch(
                 "Role", self.rbac_v1.list_role_for_all_namespaces,
-                "role-watch", rs.scan_single_role)),
-            asyncio.create_task(self.watch_mgr.create_deletion_only_watch(
-                "Namespace", self.v1.list_namespace, "ns-watch", namespaced=False)),
-            asyncio.create_task(self.watch_mgr.create_deletion_only_watch(
-                "DaemonSet", self.apps_v1.list_daemon_set_for_all_namespaces, "ds-watch")),
-            asyncio.create_task(self.watch_mgr.create_deletion_only_watch(
-                "StatefulSet", self.apps_v1.list_stateful_set_for_all_namespaces, "sts-watch")),
-            asyncio.create_task(self.watch_mgr.create_namespaced_watch(
+                "role-watch", rs.scan_single_role),
+            self.watch_mgr.create_deletion_only_watch(
+                "Namespace", self.v1.list_namespace, "ns-watch", namespaced=False),
+            self.watch_mgr.create_deletion_only_watch(
+                "DaemonSet", self.apps_v1.list_daemon_set_for_all_namespaces, "ds-watch"),
+            self.watch_mgr.create_deletion_only_watch(
+                "StatefulSet", self.apps_v1.list_stateful_set_for_all_namespaces, "sts-watch"),
+            self.watch_mgr.create_namespaced_watch(
                 "Ingress", self.networking_v1.list_ingress_for_all_namespaces,
-                "ingress-watch", rs.scan_single_ingress)),
-            asyncio.create_task(self.watch_mgr.create_namespaced_watch(
+                "ingress-watch", rs.scan_single_ingress),
+            self.watch_mgr.create_namespaced_watch(
                 "CronJob", self.batch_v1.list_cron_job_for_all_namespaces,
-                "cj-watch", rs.scan_single_cronjob, handle_403=True)),
-            asyncio.create_task(self.websocket_client.connect()),
+                "cj-watch", rs.scan_single_cronjob, handle_403=True),
+            self.websocket_client.connect(),
         ]
 
+        # A crash in any consumer cancels the others and waits for them to
+        # unwind before the error propagates; each failure is logged here so
+        # it isn't buried in the group traceback
         try:
-            await asyncio.gather(*watch_tasks)
+            async with asyncio.TaskGroup() as tg:
+                for coro in watches:
+                    tg.create_task(coro)
+        except* Exception as group:
+            for exc in group.exceptions:
+                logger.error(f"Scanner task failed: {exc!r}", exc_info=exc)
+            raise
         finally:
-            for task in watch_tasks:
-                task.cancel()
             await self.websocket_client.disconnect()
+            await self.backend_client.close()
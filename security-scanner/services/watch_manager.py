@@ -29,6 +29,8 @@ class WatchManager:
             if resource_key in self.scanner.tracked_resources:
                 self.scanner.tracked_resources.discard(resource_key)
                 logger.info(f"Resource deleted: {resource_type}/{namespace}/{resource_name} - removing findings")
+                # Send findings buffered by a running scan first so they can't land after the delete
+                await self.scanner.flush_findings()
                 await self.scanner.backend_client.delete_findings_by_resource(resource_type, namespace, resource_name)
 
     def _create_sync_watch(self, api_method, resource_type: str,
@@ -0,0 +1,545 @@
+import asyncio
+import json
+import random
+import socket
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from services import backend_client as backend_client_module
+from services.backend_client import (
+    BREAKER_FAIL_THRESHOLD,
+    BackendClient,
+    DELETE_COALESCE_WINDOW,
+    FINDING_REPORT_CONCURRENCY,
+    RETRY_MAX_ATTEMPTS,
+    _CircuitBreaker,
+    backend_deadline,
+)
+
+
+@pytest_asyncio.fixture
+async def backend_server():
+    """Local HTTP server standing in for the backend; records every request.
+
+    Requests are answered with the next entry of ``statuses`` while any are
+    queued, then with ``status``, after the next of ``delays`` (then
+    ``delay``) seconds. ``peak`` records the most requests seen in flight
+    at once.
+    """
+    received = []
+    reply = {"status": 200, "statuses": [], "body": [], "delay": 0, "delays": [],
+             "in_flight": 0, "peak": 0}
+
+    async def handle(request):
+        received.append({
+            "method": request.method,
+            "path": request.path,
+            "headers": dict(request.headers),
+            "body": await request.read(),
+            "peer": request.transport.get_extra_info("peername"),
+        })
+        reply["in_flight"] += 1
+        reply["peak"] = max(reply["peak"], reply["in_flight"])
+        await asyncio.sleep(reply["delays"].pop(0) if reply["delays"] else reply["delay"])
+        reply["in_flight"] -= 1
+        status = reply["statuses"].pop(0) if reply["statuses"] else reply["status"]
+        return web.json_response(reply["body"], status=status)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("")).rstrip("/"), received, reply
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def client(backend_server, monkeypatch):
+    monkeypatch.setenv("SERVICE_TOKEN", "outbound-token")
+    monkeypatch.setattr(backend_client_module, "RETRY_BASE_DELAY", 0)
+    url, _, _ = backend_server
+    backend_client = BackendClient(url)
+    yield backend_client
+    await backend_client.close()
+
+
+class TestBackendClientSession:
+
+    @pytest.mark.asyncio
+    async def test_calls_share_one_keep_alive_connection(self, client, backend_server):
+        """Sequential calls reuse the pooled session instead of reconnecting"""
+        _, received, _ = backend_server
+
+        assert await client.clear_security_findings() is True
+        session = client._session
+        assert await client.report_scan_duration(1.5) is True
+
+        assert client._session is session
+        assert [r["path"] for r in received] == [
+            "/api/security/scan/clear",
+            "/api/metrics/security-scan-duration",
+        ]
+        assert received[0]["peer"] == received[1]["peer"]
+        assert all(r["headers"]["X-Service-Token"] == "outbound-token" for r in received)
+
+    @pytest.mark.asyncio
+    async def test_status_only_calls_reuse_connection_after_large_ack(self, client, backend_server):
+        """Unreturned ack bodies are still drained, so the connection is pooled"""
+        _, received, reply = backend_server
+        reply["body"] = {"padding": "x" * 256 * 1024}
+
+        assert await client.clear_security_findings() is True
+        assert await client.report_scan_duration(1.5) is True
+
+        assert received[0]["peer"] == received[1]["peer"]
+
+    @pytest.mark.asyncio
+    async def test_close_releases_session_and_next_call_reopens(self, client):
+        await client.clear_security_findings()
+        first = client._session
+
+        await client.close()
+        assert first.closed
+        assert client._session is None
+
+        assert await client.clear_security_findings() is True
+        assert client._session is not first
+
+    @pytest.mark.asyncio
+    async def test_connector_is_dual_stack_unless_ipv4_only(self, client):
+        connector = (await client._get_session()).connector
+        assert connector.family == socket.AF_UNSPEC
+
+        client.ipv4_only = True
+        await client.close()
+        connector = (await client._get_session()).connector
+        assert connector.family == socket.AF_INET
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_session(self, backend_server):
+        url, _, _ = backend_server
+
+        async with BackendClient(url) as backend_client:
+            await backend_client.clear_security_findings()
+            session = backend_client._session
+
+        assert session.closed
+
+
+class TestBackendClientRetry:
+
+    @pytest.mark.asyncio
+    async def test_transient_statuses_are_retried(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["statuses"] = [503, 429]
+
+        assert await client.report_security_finding({"resource_type": "Pod"}) is True
+        assert len(received) == 3
+        assert received[0]["body"] == received[2]["body"]
+
+    @pytest.mark.asyncio
+    async def test_auth_failure_is_not_retried(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["status"] = 401
+
+        assert await client.report_security_finding({"resource_type": "Pod"}) is False
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["status"] = 500
+
+        assert await client.clear_security_findings() is False
+        assert len(received) == RETRY_MAX_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_timed_out_ingest_is_resent_only_when_idempotent(self, client, backend_server, monkeypatch):
+        """An upserted finding is resent after a timeout; a batch, which may
+        already have been applied, is not"""
+        _, received, reply = backend_server
+        monkeypatch.setattr(backend_client_module, "ATTEMPT_TIMEOUT_MIN", 0.05)
+        finding = {"resource_type": "Pod", "namespace": "default", "resource_name": "p"}
+
+        reply["delays"] = [2.0]
+        with backend_deadline(0.9):
+            assert await client.report_security_findings_batch([finding]) is False
+        assert len(received) == 1
+
+        reply["delays"] = [2.0]
+        with backend_deadline(0.9):
+            assert await client.report_security_finding(finding) is True
+        assert len(received) == 3
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_raise_after_retries(self, monkeypatch):
+        monkeypatch.setattr(backend_client_module, "RETRY_BASE_DELAY", 0)
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        async with BackendClient(f"http://127.0.0.1:{port}") as backend_client:
+            with pytest.raises(Exception, match="HTTP client error"):
+                await backend_client.get_excluded_namespaces()
+
+
+class TestBackendClientBatch:
+
+    FINDING = {"resource_type": "Pod", "namespace": "default", "resource_name": "p", "title": "t"}
+
+    @pytest.mark.asyncio
+    async def test_batch_is_sent_in_one_request(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["body"] = {"saved": 2, "errors": []}
+
+        assert await client.report_security_findings_batch([self.FINDING, self.FINDING]) is True
+        assert [r["path"] for r in received] == ["/api/security/findings/batch"]
+        assert json.loads(received[0]["body"]) == {"findings": [self.FINDING, self.FINDING]}
+        assert received[0]["headers"]["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_rejected_items_fail_the_batch(self, client, backend_server):
+        _, _, reply = backend_server
+        reply["body"] = {"saved": 1, "errors": [{"index": 1, "detail": "bad finding"}]}
+
+        assert await client.report_security_findings_batch([self.FINDING, self.FINDING]) is False
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_reports_on_old_backend(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["statuses"] = [404]
+
+        assert await client.report_security_findings_batch([self.FINDING, self.FINDING]) is True
+        assert [r["path"] for r in received] == [
+            "/api/security/findings/batch",
+            "/api/security/findings",
+            "/api/security/findings",
+        ]
+
+
+class TestBackendClientDeleteCoalescing:
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_one_window_are_sent_as_one_batch(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["body"] = {"count": 2}
+
+        await client.delete_findings_by_resource("Pod", "default", "a")
+        await client.delete_findings_by_resource("Pod", "default", "b")
+        await client.delete_findings_by_resource("Pod", "default", "a")
+        assert received == []
+
+        await asyncio.sleep(DELETE_COALESCE_WINDOW * 2)
+        await client.flush_deletes()
+
+        assert [r["path"] for r in received] == ["/api/security/findings/resource/batch"]
+        items = json.loads(received[0]["body"])["items"]
+        assert sorted(item["resource_name"] for item in items) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_report_sends_queued_deletes_first(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["body"] = {"count": 1}
+
+        await client.delete_findings_by_resource("Pod", "default", "a")
+        assert await client.report_security_finding(
+            {"resource_type": "Pod", "namespace": "default", "resource_name": "a"}
+        ) is True
+
+        assert [r["path"] for r in received] == [
+            "/api/security/findings/resource/batch",
+            "/api/security/findings",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_report_for_other_resource_leaves_deletes_queued(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["body"] = {"count": 1}
+
+        await client.delete_findings_by_resource("Pod", "default", "a")
+        assert await client.report_security_finding(
+            {"resource_type": "Pod", "namespace": "default", "resource_name": "b"}
+        ) is True
+        assert [r["path"] for r in received] == ["/api/security/findings"]
+
+        await client.flush_deletes()
+        assert received[-1]["path"] == "/api/security/findings/resource/batch"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_deletes_on_old_backend(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["statuses"] = [404]
+        reply["body"] = {"count": 1}
+
+        await client.delete_findings_by_resource("Pod", "default", "a")
+        await client.flush_deletes()
+
+        assert [(r["method"], r["path"]) for r in received] == [
+            ("POST", "/api/security/findings/resource/batch"),
+            ("DELETE", "/api/security/findings/resource/Pod/default/a"),
+        ]
+
+
+class TestBackendClientBackground:
+
+    @pytest.mark.asyncio
+    async def test_scan_duration_can_report_in_background(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["delay"] = 0.05
+
+        assert await client.report_scan_duration(1.5, wait=False) is None
+        assert len(client._bg_tasks) == 1
+
+        await client.close()
+        assert [r["path"] for r in received] == ["/api/metrics/security-scan-duration"]
+        assert not client._bg_tasks
+
+
+class TestBackendClientCompression:
+
+    @pytest.mark.asyncio
+    async def test_large_bodies_are_gzipped(self, client, backend_server):
+        _, received, _ = backend_server
+        finding = {"resource_type": "Pod", "manifest": "apiVersion: v1\n" * 200}
+
+        assert await client.report_security_finding(finding) is True
+        # aiohttp's server decodes the body; Content-Length is the size on the wire
+        assert received[0]["headers"]["Content-Encoding"] == "gzip"
+        assert int(received[0]["headers"]["Content-Length"]) < len(json.dumps(finding)) // 10
+        assert json.loads(received[0]["body"]) == finding
+
+    @pytest.mark.asyncio
+    async def test_small_bodies_are_sent_plain(self, client, backend_server):
+        _, received, _ = backend_server
+
+        assert await client.report_scan_duration(1.5) is True
+        assert "Content-Encoding" not in received[0]["headers"]
+        assert json.loads(received[0]["body"]) == {"duration_seconds": 1.5}
+
+
+class TestBackendClientConcurrency:
+
+    @pytest.mark.asyncio
+    async def test_report_many_runs_concurrently_within_the_bulkhead(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["delay"] = 0.02
+        findings = [{"resource_type": "Pod", "resource_name": f"p{i}"} for i in range(FINDING_REPORT_CONCURRENCY * 2)]
+
+        assert await client.report_many(findings) is True
+        assert len(received) == len(findings)
+        assert 1 < reply["peak"] <= FINDING_REPORT_CONCURRENCY
+
+
+class TestBackendClientCircuitBreaker:
+
+    async def _trip(self, client, reply):
+        reply["status"] = 500
+        for _ in range(BREAKER_FAIL_THRESHOLD):
+            assert await client.clear_security_findings() is False
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_the_network(self, client, backend_server):
+        _, received, reply = backend_server
+        await self._trip(client, reply)
+        sent = len(received)
+
+        assert await client.report_security_finding({"resource_type": "Pod"}) is False
+        with pytest.raises(Exception, match="circuit open"):
+            await client.get_excluded_rules()
+        assert len(received) == sent
+
+    @pytest.mark.asyncio
+    async def test_successful_probe_closes_breaker(self, client, backend_server):
+        _, received, reply = backend_server
+        await self._trip(client, reply)
+        client._breaker.reset_after = 0
+        reply["status"] = 200
+
+        assert await client.clear_security_findings() is True
+        assert client._breaker.state == client._breaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_reopens_breaker(self, client, backend_server):
+        _, received, reply = backend_server
+        await self._trip(client, reply)
+        client._breaker.reset_after = 0
+
+        assert await client.clear_security_findings() is False
+        assert client._breaker.state == client._breaker.OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip_breaker(self, client, backend_server):
+        _, _, reply = backend_server
+        reply["status"] = 401
+
+        for _ in range(BREAKER_FAIL_THRESHOLD + 1):
+            assert await client.clear_security_findings() is False
+        assert client._breaker.state == client._breaker.CLOSED
+
+
+class TestBackendClientDeadline:
+
+    @pytest.mark.asyncio
+    async def test_deadline_cuts_a_slow_request_short(self, client, backend_server):
+        _, received, reply = backend_server
+        reply["delay"] = 1.0
+
+        started = time.monotonic()
+        with backend_deadline(0.1):
+            assert await client.clear_security_findings() is False
+
+        assert time.monotonic() - started < 0.5
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_no_retry_when_backoff_would_pass_the_deadline(self, client, backend_server, monkeypatch):
+        _, received, reply = backend_server
+        reply["status"] = 503
+        monkeypatch.setattr(backend_client_module, "RETRY_BASE_DELAY", 1.0)
+        monkeypatch.setattr(backend_client_module.random, "uniform", lambda low, high: high)
+
+        with backend_deadline(0.5):
+            assert await client.clear_security_findings() is False
+
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_hung_attempt_is_retried_within_the_deadline(self, client, backend_server, monkeypatch):
+        """One hang costs a slice of the budget, not all of it"""
+        _, received, reply = backend_server
+        reply["delays"] = [2.0]
+        monkeypatch.setattr(backend_client_module, "ATTEMPT_TIMEOUT_MIN", 0.05)
+
+        started = time.monotonic()
+        with backend_deadline(0.9):
+            assert await client.clear_security_findings() is True
+
+        assert time.monotonic() - started < 0.9
+        assert len(received) == 2
+
+    @pytest.mark.asyncio
+    async def test_nested_deadline_only_tightens(self):
+        with backend_deadline(0.1):
+            outer = backend_client_module._deadline.get()
+            with backend_deadline(60):
+                assert backend_client_module._deadline.get() == outer
+        assert backend_client_module._deadline.get() is None
+
+
+@pytest_asyncio.fixture
+async def chaos_server():
+    """Backend stand-in that injects faults chosen by a seeded RNG.
+
+    While fewer than ``limit`` faults have been injected, each request gets
+    one of ``faults`` with probability ``rate``; otherwise it succeeds.
+    ``injected`` lists the faults in order and ``served`` counts successes.
+    """
+    chaos = {
+        "rng": random.Random(20240611), "rate": 1.0, "faults": (), "limit": None,
+        "injected": [], "served": 0, "retry_after": "0",
+    }
+
+    async def handle(request):
+        await request.read()
+        limit = chaos["limit"]
+        if (limit is None or len(chaos["injected"]) < limit) and chaos["rng"].random() < chaos["rate"]:
+            fault = chaos["rng"].choice(chaos["faults"])
+            chaos["injected"].append(fault)
+            if fault == "timeout":
+                await asyncio.sleep(5)
+            elif fault == "http_5xx":
+                return web.json_response({"detail": "chaos"}, status=503)
+            elif fault == "http_429":
+                return web.json_response({"detail": "slow down"}, status=429,
+                                         headers={"Retry-After": chaos["retry_after"]})
+            elif fault == "slow":
+                await asyncio.sleep(0.02)
+            elif fault == "partial":
+                response = web.StreamResponse(headers={"Content-Type": "application/json", "Content-Length": "64"})
+                await response.prepare(request)
+                await response.write(b'[{"namespace": ')
+                request.transport.close()
+                return response
+            elif fault == "malformed_json":
+                return web.Response(body=b'[{"rule_title": ', content_type="application/json")
+        chaos["served"] += 1
+        return web.json_response([{"namespace": "ns", "rule_title": "rule", "registry": "r"}])
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield str(server.make_url("")).rstrip("/"), chaos
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def chaos_client(chaos_server, monkeypatch):
+    monkeypatch.setattr(backend_client_module, "RETRY_BASE_DELAY", 0.001)
+    url, _ = chaos_server
+    backend_client = BackendClient(url)
+    yield backend_client
+    await backend_client.close()
+
+
+class TestBackendClientChaos:
+    """Reliability features hold up against a flaky backend"""
+
+    @pytest.mark.asyncio
+    async def test_seeded_transient_faults_are_retried_to_success(self, chaos_client, chaos_server):
+        _, chaos = chaos_server
+        chaos.update(rate=0.3, faults=("http_5xx", "http_429", "slow"))
+
+        for i in range(40):
+            assert await chaos_client.report_security_finding({"resource_type": "Pod", "resource_name": f"p{i}"})
+
+        assert chaos["served"] == 40
+        assert set(chaos["injected"]) == {"http_5xx", "http_429", "slow"}
+        assert chaos_client._breaker.state == _CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honoured(self, chaos_client, chaos_server):
+        _, chaos = chaos_server
+        chaos.update(faults=("http_429",), limit=1, retry_after="0.2")
+
+        started = time.monotonic()
+        assert await chaos_client.clear_security_findings() is True
+
+        assert time.monotonic() - started >= 0.2
+        assert chaos["injected"] == ["http_429"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_json_fails_the_fetch_but_not_the_breaker(self, chaos_client, chaos_server):
+        _, chaos = chaos_server
+        chaos.update(faults=("malformed_json",))
+
+        with pytest.raises(Exception, match="Error fetching excluded rules"):
+            await chaos_client.get_excluded_rules()
+        assert chaos_client._breaker.state == _CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_partial_response_raises(self, chaos_client, chaos_server):
+        _, chaos = chaos_server
+        chaos.update(faults=("partial",), limit=1)
+
+        with pytest.raises(Exception):
+            await chaos_client.get_excluded_namespaces()
+        assert await chaos_client.get_excluded_namespaces() == ["ns"]
+
+    @pytest.mark.asyncio
+    async def test_hanging_backend_opens_breaker_within_deadlines(self, chaos_client, chaos_server):
+        _, chaos = chaos_server
+        chaos.update(faults=("timeout",))
+
+        started = time.monotonic()
+        for _ in range(BREAKER_FAIL_THRESHOLD):
+            with backend_deadline(0.05):
+                assert await chaos_client.clear_security_findings() is False
+
+        assert time.monotonic() - started < 2
+        assert chaos_client._breaker.state == _CircuitBreaker.OPEN
+        assert len(chaos["injected"]) == BREAKER_FAIL_THRESHOLD